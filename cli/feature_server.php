@@ -0,0 +1,71 @@
+<?php
+declare(strict_types=1);
+
+/**
+ * Persistent feature-extraction worker for the Python test suite.
+ *
+ * Reads one JSON request per line on stdin and writes one JSON response per
+ * line on stdout, so PHP startup + autoload is paid once per test session
+ * instead of once per extraction.
+ *
+ * Requests:
+ *   {"cmd": "reference"}
+ *       -> {"features": [...], "state": {...}}  (canonical cross-validation state)
+ *   {"cmd": "extract", "state": {...}, "perspective": "home"}
+ *       -> {"features": [...]}
+ */
+
+require_once __DIR__ . '/../vendor/autoload.php';
+
+use App\AI\FeatureExtractor;
+use App\DTO\BallState;
+use App\DTO\GameState;
+use App\DTO\MatchPlayerDTO;
+use App\DTO\TeamStateDTO;
+use App\Enum\GamePhase;
+use App\Enum\TeamSide;
+use App\Enum\Weather;
+use App\ValueObject\PlayerStats;
+use App\ValueObject\Position;
+
+function referenceState(): GameState
+{
+    $homeTeam = TeamStateDTO::create(1, 'Home', 'Human', TeamSide::HOME, 3)->withScore(1);
+    $awayTeam = TeamStateDTO::create(2, 'Away', 'Orc', TeamSide::AWAY, 2);
+
+    $p1 = MatchPlayerDTO::create(1, 1, 'P1', 1, 'Blitzer', new PlayerStats(6, 3, 3, 8), [], TeamSide::HOME, new Position(10, 7));
+    $p2 = MatchPlayerDTO::create(2, 2, 'P2', 2, 'Lineman', new PlayerStats(6, 3, 3, 8), [], TeamSide::AWAY, new Position(15, 7));
+
+    return new GameState(
+        matchId: 1, half: 1, phase: GamePhase::PLAY, activeTeam: TeamSide::HOME,
+        homeTeam: $homeTeam, awayTeam: $awayTeam,
+        players: [1 => $p1, 2 => $p2],
+        ball: BallState::carried(new Position(10, 7), 1),
+        turnoverPending: false, kickingTeam: TeamSide::AWAY, weather: Weather::NICE,
+    );
+}
+
+while (($line = fgets(STDIN)) !== false) {
+    $line = trim($line);
+    if ($line === '') {
+        continue;
+    }
+    try {
+        $req = json_decode($line, true, 512, JSON_THROW_ON_ERROR);
+        $cmd = $req['cmd'] ?? '';
+        if ($cmd === 'reference') {
+            $state = referenceState();
+            $features = FeatureExtractor::extract($state, TeamSide::HOME);
+            echo json_encode(['features' => $features, 'state' => $state->toArray()]), "\n";
+        } elseif ($cmd === 'extract') {
+            $state = GameState::fromArray((array) $req['state']);
+            $side = TeamSide::from((string) ($req['perspective'] ?? 'home'));
+            echo json_encode(['features' => FeatureExtractor::extract($state, $side)]), "\n";
+        } else {
+            echo json_encode(['error' => "unknown cmd: {$cmd}"]), "\n";
+        }
+    } catch (Throwable $e) {
+        echo json_encode(['error' => $e->getMessage()]), "\n";
+    }
+    flush();
+}
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Callable, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class MatchResult:
     home_score: int
     away_score: int
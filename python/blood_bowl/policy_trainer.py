@@ -38,15 +38,17 @@ class PolicyTrainer:
         - state_features: np.array of shape (70,)
         - visits: list of {action_features: np.array(15,), visit_fraction: float}
 
-        Returns average cross-entropy loss over all decisions.
+        The decision dicts are parsed into input/target matrices once; extra
+        `passes` reuse the stacked arrays (previously this trainer silently
+        ignored `passes`, so the imitation phase got a single pass).
+
+        Returns average cross-entropy loss over the final pass.
         """
         if not decisions:
             return 0.0
 
-        total_loss = 0.0
-        n_decisions = 0
-        n_top1 = 0
-
+        # Parse once: each decision becomes (inputs, targets) matrices
+        parsed = []
         for dec in decisions:
             state_feats = np.array(dec['state_features'], dtype=np.float64)
             visits = dec.get('visits', [])
@@ -72,42 +74,50 @@ class PolicyTrainer:
             target_sum = targets.sum()
             if target_sum > 0:
                 targets /= target_sum
+            parsed.append((inputs, targets))
 
-            # Forward: logits = inputs @ weights + bias
-            logits = inputs @ self.weights + self.bias
-
-            # Softmax (numerically stable)
-            logits_shifted = logits - logits.max()
-            exp_logits = np.exp(logits_shifted)
-            probs = exp_logits / exp_logits.sum()
+        if not parsed:
+            return 0.0
 
-            # Cross-entropy loss: -sum(targets * log(probs))
-            loss = -np.sum(targets * np.log(probs + 1e-8))
-            total_loss += loss
+        total_loss = 0.0
+        n_top1 = 0
+        for _ in range(max(passes, 1)):
+            total_loss = 0.0
+            n_top1 = 0
+            for inputs, targets in parsed:
+                # Forward: logits = inputs @ weights + bias
+                logits = inputs @ self.weights + self.bias
+
+                # Softmax (numerically stable)
+                logits_shifted = logits - logits.max()
+                exp_logits = np.exp(logits_shifted)
+                probs = exp_logits / exp_logits.sum()
 
-            # Prior↔visit shoda: vybrala by policy nejnavštěvovanější MCTS tah?
-            if np.argmax(probs) == np.argmax(targets):
-                n_top1 += 1
+                # Cross-entropy loss: -sum(targets * log(probs))
+                loss = -np.sum(targets * np.log(probs + 1e-8))
+                total_loss += loss
 
-            # Gradient: d_loss/d_logits = probs - targets (softmax + CE)
-            grad_logits = probs - targets  # shape (n_actions,)
+                # Prior↔visit shoda: vybrala by policy nejnavštěvovanější MCTS tah?
+                if np.argmax(probs) == np.argmax(targets):
+                    n_top1 += 1
 
-            # d_loss/d_weights = sum_i grad_logits[i] * inputs[i]
-            grad_weights = grad_logits @ inputs  # shape (n_features,)
-            grad_bias = grad_logits.sum()
+                # Gradient: d_loss/d_logits = probs - targets (softmax + CE)
+                grad_logits = probs - targets  # shape (n_actions,)
 
-            # Update with gradient clipping
-            self.weights -= self.lr * grad_weights
-            self.bias -= self.lr * grad_bias
+                # d_loss/d_weights = sum_i grad_logits[i] * inputs[i]
+                grad_weights = grad_logits @ inputs  # shape (n_features,)
+                grad_bias = grad_logits.sum()
 
-            # Clip weights to prevent extreme values
-            np.clip(self.weights, -5.0, 5.0, out=self.weights)
-            self.bias = max(-5.0, min(5.0, self.bias))
+                # Update with gradient clipping
+                self.weights -= self.lr * grad_weights
+                self.bias -= self.lr * grad_bias
 
-            n_decisions += 1
+                # Clip weights to prevent extreme values
+                np.clip(self.weights, -5.0, 5.0, out=self.weights)
+                self.bias = max(-5.0, min(5.0, self.bias))
 
-        self.last_top1_agreement = n_top1 / max(n_decisions, 1)
-        return total_loss / max(n_decisions, 1)
+        self.last_top1_agreement = n_top1 / len(parsed)
+        return total_loss / len(parsed)
 
     def save_weights(self, path: str) -> None:
         """Save policy weights as JSON."""
@@ -358,10 +368,10 @@ def load_combined_weights(
 
     Returns (value_trainer, policy_trainer).
     """
-    from .trainer import LinearTrainer, NeuralTrainer, load_trainer, _expand_value_W1
+    from .trainer import (LinearTrainer, NeuralTrainer, load_trainer,
+                          _expand_value_W1, _load_weights_json)
 
-    with open(path) as f:
-        data = json.load(f)
+    data = _load_weights_json(path)
 
     # Detect policy type from saved data
     saved_policy_type = data.get('policy_type', 'linear') if isinstance(data, dict) else 'linear'
@@ -1,6 +1,7 @@
 """Experience replay buffer for RL training."""
 from __future__ import annotations
 
+import json
 import pickle
 import random
 from collections import deque
@@ -8,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+
 from .rewards import episode_returns, episode_step_rewards, terminal_value
 
 
@@ -30,9 +33,9 @@ class Transition:
     None for buffers pickled before this field existed; consumers fall back
     to 0.0 (correct for any transition without a TD).
     """
-    features: list
+    features: np.ndarray
     reward: float
-    next_features: list
+    next_features: np.ndarray
     perspective: str
     is_terminal: bool
     mc_return: Optional[float] = None
@@ -40,11 +43,106 @@ class Transition:
 
 
 class ReplayBuffer:
-    """Circular buffer storing game transitions for experience replay."""
+    """Circular buffer storing game transitions for experience replay.
+
+    Default storage is an in-memory deque of Transition objects. Passing
+    `memmap_dir` switches to disk-backed float32 arrays (np.memmap, one file
+    per field) so large capacities no longer have to fit in RAM and the
+    buffer persists across runs without the pickle save/load round-trip.
+    The memmap arrays are allocated lazily on the first add_game() call,
+    when the feature dimension is known.
+    """
 
-    def __init__(self, capacity: int = 50000):
-        self.buffer: deque = deque(maxlen=capacity)
+    _MEMMAP_FIELDS = ('features', 'next_features', 'reward',
+                      'mc_return', 'reward_step', 'is_terminal', 'perspective')
+
+    def __init__(self, capacity: int = 50000, memmap_dir: Optional[str] = None):
         self.capacity = capacity
+        self.memmap_dir = memmap_dir
+        if memmap_dir is None:
+            self.buffer: deque = deque(maxlen=capacity)
+        else:
+            self._arrays: Optional[dict] = None
+            self._size = 0
+            self._top = 0  # next write index (circular)
+            meta_path = Path(memmap_dir) / 'meta.json'
+            if meta_path.exists():
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                if meta['capacity'] == capacity:
+                    self._open_arrays(meta['feat_dim'], mode='r+')
+                    self._size = meta['size']
+                    self._top = meta['top']
+                # capacity mismatch: start fresh, arrays reallocated on first add
+
+    def _open_arrays(self, feat_dim: int, mode: str) -> None:
+        d = Path(self.memmap_dir)
+        d.mkdir(parents=True, exist_ok=True)
+        cap = self.capacity
+        shapes = {
+            'features': (cap, feat_dim),
+            'next_features': (cap, feat_dim),
+            'reward': (cap,),
+            'mc_return': (cap,),
+            'reward_step': (cap,),
+            'is_terminal': (cap,),
+            'perspective': (cap,),
+        }
+        dtypes = {'is_terminal': np.bool_, 'perspective': np.int8}
+        self._arrays = {
+            name: np.memmap(str(d / (name + '.dat')), mode=mode,
+                            dtype=dtypes.get(name, np.float32), shape=shapes[name])
+            for name in self._MEMMAP_FIELDS
+        }
+        self._feat_dim = feat_dim
+
+    def _write_meta(self) -> None:
+        meta = {'capacity': self.capacity, 'feat_dim': self._feat_dim,
+                'size': self._size, 'top': self._top}
+        with open(Path(self.memmap_dir) / 'meta.json', 'w') as f:
+            json.dump(meta, f)
+
+    def _append(self, t: Transition) -> None:
+        """Append a transition to whichever storage backend is active."""
+        if self.memmap_dir is None:
+            self.buffer.append(t)
+            return
+        if self._arrays is None:
+            self._open_arrays(len(t.features), mode='w+')
+        elif len(t.features) != self._feat_dim:
+            # Feature schema changed (NUM_FEATURES grows over time — that's
+            # why _align_features exists): the persisted store can't hold the
+            # new vectors, so start fresh like the capacity-mismatch path.
+            self._size = 0
+            self._top = 0
+            self._open_arrays(len(t.features), mode='w+')
+        i = self._top
+        a = self._arrays
+        a['features'][i] = t.features
+        a['next_features'][i] = t.next_features
+        a['reward'][i] = t.reward
+        # NaN encodes the mc_return=None sentinel — consumers fall back to
+        # the one-step target, and training toward a literal 0.0 would be
+        # wrong. reward_step's fallback IS 0.0, so it can store that directly.
+        a['mc_return'][i] = t.mc_return if t.mc_return is not None else np.nan
+        a['reward_step'][i] = t.reward_step if t.reward_step is not None else 0.0
+        a['is_terminal'][i] = t.is_terminal
+        a['perspective'][i] = 1 if t.perspective == 'away' else 0
+        self._top = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _row(self, i: int) -> Transition:
+        a = self._arrays
+        mc_return = float(a['mc_return'][i])
+        return Transition(
+            features=np.array(a['features'][i], dtype=np.float32),
+            reward=float(a['reward'][i]),
+            next_features=np.array(a['next_features'][i], dtype=np.float32),
+            perspective='away' if a['perspective'][i] else 'home',
+            is_terminal=bool(a['is_terminal'][i]),
+            mc_return=None if np.isnan(mc_return) else mc_return,
+            reward_step=float(a['reward_step'][i]),
+        )
 
     def add_game(self, game_log: list, gamma: float = 0.99) -> None:
         """Extract transitions from a game log and add them to the buffer.
@@ -102,12 +200,16 @@ class ReplayBuffer:
                            for i in range(n_states)]
                 step_rewards = [0.0] * n_states
 
+            # One float32 array per state instead of per-transition list copies;
+            # next_features shares the following state's array
+            feats = [np.asarray(s['features'], dtype=np.float32) for s in states]
+
             for i, record in enumerate(states):
-                features = record['features']
+                features = feats[i]
                 is_terminal = (i == n_states - 1)
-                next_features = states[i + 1]['features'] if not is_terminal else features
+                next_features = feats[i + 1] if not is_terminal else features
 
-                self.buffer.append(Transition(
+                self._append(Transition(
                     features=features,
                     reward=reward,
                     next_features=next_features,
@@ -117,22 +219,75 @@ class ReplayBuffer:
                     reward_step=step_rewards[i],
                 ))
 
+    def add_games(self, game_logs: list, gamma: float = 0.99) -> None:
+        """Add several game logs at once.
+
+        Walks from the newest log backwards until `capacity` transitions are
+        covered; older logs cannot contribute a surviving transition, so
+        their extraction (and the churn of writing entries only to evict
+        them) is skipped entirely.
+        """
+        start = len(game_logs)
+        covered = 0
+        while start > 0 and covered < self.capacity:
+            start -= 1
+            log = game_logs[start]
+            if any(r.get('type') == 'result' for r in log):
+                covered += sum(1 for r in log if r.get('type') == 'state')
+        for log in game_logs[start:]:
+            self.add_game(log, gamma=gamma)
+
     def sample(self, batch_size: int = 64) -> List[Transition]:
         """Sample random transitions from the buffer."""
-        n = min(batch_size, len(self.buffer))
-        return random.sample(list(self.buffer), n)
+        n = min(batch_size, len(self))
+        if self.memmap_dir is None:
+            return random.sample(list(self.buffer), n)
+        indices = random.sample(range(self._size), n)
+        return [self._row(i) for i in indices]
+
+    def flush(self) -> None:
+        """Flush memmap-backed storage to disk (no-op for the deque backend)."""
+        if self.memmap_dir is None or self._arrays is None:
+            return
+        for arr in self._arrays.values():
+            arr.flush()
+        self._write_meta()
 
     def save(self, path: str) -> None:
-        """Save buffer to a pickle file."""
+        """Save buffer contents to a pickle file.
+
+        The memmap backend persists in place via flush(), but save() still
+        exports a portable transition snapshot to `path` (oldest first) —
+        run_iteration.py archives that pickle after every iteration."""
+        if self.memmap_dir is not None:
+            self.flush()
+            if self._arrays is None:
+                data = []
+            else:
+                start = self._top if self._size == self.capacity else 0
+                data = [self._row((start + k) % self.capacity)
+                        for k in range(self._size)]
+        else:
+            data = list(self.buffer)
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with open(path, 'wb') as f:
-            pickle.dump(list(self.buffer), f)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load(self, path: str) -> None:
-        """Load buffer from a pickle file."""
+        """Load buffer from a pickle file.
+
+        For a memmap-backed buffer this appends the pickled transitions (used
+        to migrate a legacy replay_buffer.pkl into the disk-backed store)."""
         with open(path, 'rb') as f:
             data = pickle.load(f)
+        if self.memmap_dir is not None:
+            for t in data:
+                self._append(t)
+            self.flush()
+            return
         self.buffer = deque(data, maxlen=self.capacity)
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        if self.memmap_dir is None:
+            return len(self.buffer)
+        return self._size
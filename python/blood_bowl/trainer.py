@@ -10,6 +10,92 @@ import numpy as np
 from .features import NUM_FEATURES
 from .rewards import episode_returns, episode_step_rewards, terminal_value
 
+try:
+    from numba import njit as _njit
+
+    def _maybe_njit(fn):
+        return _njit(cache=True, fastmath=True)(fn)
+except ImportError:  # numba is optional — kernels run as plain Python
+    def _maybe_njit(fn):
+        return fn
+
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is optional — stdlib json is the fallback
+    _orjson = None
+
+
+def _dump_weights_json(data, path: str) -> None:
+    """Write a weights JSON file.
+
+    With orjson installed, numpy arrays serialize in one C call
+    (OPT_SERIALIZE_NUMPY); the stdlib fallback converts them via tolist().
+    Output is plain JSON either way (PHP LearningAICoach keeps reading it).
+    """
+    if _orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(_orjson.dumps(data, option=_orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, default=lambda o: o.tolist())
+
+
+def _parse_weights_json(path: str):
+    """Read + parse a weights JSON file (orjson when available)."""
+    if _orjson is not None:
+        with open(path, 'rb') as f:
+            return _orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+@_maybe_njit
+def _mc_kernel(weights: np.ndarray, feats: np.ndarray, rewards: np.ndarray,
+               lr: float) -> None:
+    """Sequential MC updates w += lr * (G - w.f) * f over stacked features.
+
+    Mutates `weights` in place. Module-level so numba (when installed) can
+    JIT-compile it once per process; without numba the stacked float64
+    matrix still avoids per-state list->array conversion in the loop.
+    """
+    for i in range(feats.shape[0]):
+        f = feats[i]
+        v = np.dot(weights, f)
+        weights += lr * (rewards[i] - v) * f
+
+
+@_maybe_njit
+def _td0_kernel(weights: np.ndarray, feats: np.ndarray, final_reward: float,
+                gamma: float, lr: float) -> None:
+    """Sequential TD(0) updates for one perspective's state sequence."""
+    n = feats.shape[0]
+    for i in range(n):
+        f = feats[i]
+        v = np.dot(weights, f)
+        if i < n - 1:
+            td_target = gamma * np.dot(weights, feats[i + 1])
+        else:
+            td_target = final_reward
+        weights += lr * (td_target - v) * f
+
+
+@_maybe_njit
+def _td_lambda_kernel(weights: np.ndarray, feats: np.ndarray,
+                      final_reward: float, gamma: float, lambda_: float,
+                      lr: float) -> None:
+    """Sequential TD(λ) updates with an eligibility trace for one perspective."""
+    n = feats.shape[0]
+    e = np.zeros_like(weights)
+    for i in range(n):
+        f = feats[i]
+        v = np.dot(weights, f)
+        if i < n - 1:
+            td_error = gamma * np.dot(weights, feats[i + 1]) - v
+        else:
+            td_error = final_reward - v
+        e = gamma * lambda_ * e + f
+        weights += lr * td_error * e
+
 # Default shaping weights: (feature_index, weight)
 DEFAULT_SHAPING_WEIGHTS: list[tuple[int, float]] = [
     (1, 3.0),     # my_score advantage
@@ -87,20 +173,16 @@ class LinearTrainer:
 
         winner = result_record.get('winner')  # 'home', 'away', or None (draw)
 
-        # Process each state record
-        for record in game_log:
-            if record.get('type') != 'state':
-                continue
-
-            features = self._align_features(np.array(record['features'], dtype=np.float64))
-            perspective = record.get('perspective', 'home')
-            reward = self._get_reward(result_record, perspective)
-
-            # Current value estimate
-            v = float(np.dot(self.weights, features))
-
-            # TD-like update: w += lr * (reward - V(s)) * features
-            self.weights += self.lr * (reward - v) * features
+        # Stack all state records once, then run the sequential update kernel
+        # (JIT-compiled when numba is installed).
+        states = [r for r in game_log if r.get('type') == 'state']
+        if not states:
+            return
+        feats = self._stack_features(states)
+        rewards = np.array(
+            [self._get_reward(result_record, r.get('perspective', 'home'))
+             for r in states], dtype=np.float64)
+        _mc_kernel(self.weights, feats, rewards, self.lr)
 
     def train_monte_carlo_shaped(
         self,
@@ -347,22 +429,8 @@ class LinearTrainer:
 
         for perspective, states in groups.items():
             final_reward = self._get_reward(result_record, perspective)
-
-            for i, record in enumerate(states):
-                features = self._align_features(np.array(record['features'], dtype=np.float64))
-                v = float(np.dot(self.weights, features))
-
-                if i < len(states) - 1:
-                    next_features = self._align_features(
-                        np.array(states[i + 1]['features'], dtype=np.float64)
-                    )
-                    v_next = float(np.dot(self.weights, next_features))
-                    td_target = 0.0 + gamma * v_next
-                else:
-                    td_target = final_reward
-
-                td_error = td_target - v
-                self.weights += self.lr * td_error * features
+            _td0_kernel(self.weights, self._stack_features(states),
+                        final_reward, gamma, self.lr)
 
     def train_td_lambda(
         self,
@@ -373,7 +441,9 @@ class LinearTrainer:
         """Update weights using TD(λ) with eligibility traces.
 
         States are grouped by perspective (home/away independently).
-        Each perspective gets its own eligibility trace.
+        Each perspective gets its own eligibility trace. Features are
+        stacked once per perspective; the per-timestep trace loop runs in
+        _td_lambda_kernel (njit-compiled when numba is installed).
         """
         result_record = None
         for record in reversed(game_log):
@@ -390,29 +460,26 @@ class LinearTrainer:
 
         for perspective, states in groups.items():
             final_reward = self._get_reward(result_record, perspective)
-            e = np.zeros_like(self.weights)  # eligibility trace
-
-            for i, record in enumerate(states):
-                features = self._align_features(np.array(record['features'], dtype=np.float64))
-                v = float(np.dot(self.weights, features))
-
-                if i < len(states) - 1:
-                    next_features = self._align_features(
-                        np.array(states[i + 1]['features'], dtype=np.float64)
-                    )
-                    v_next = float(np.dot(self.weights, next_features))
-                    td_error = 0.0 + gamma * v_next - v
-                else:
-                    td_error = final_reward - v
-
-                e = gamma * lambda_ * e + features
-                self.weights += self.lr * td_error * e
+            # Deliberately the *online* formulation: each step's TD error is
+            # computed against the already-updated weights. A batched
+            # closed-form λ-return (single X.T @ residual) would be a GEMV,
+            # but it is the offline algorithm — different fixed point, and
+            # λ=0 would no longer reduce to sequential TD(0).
+            _td_lambda_kernel(self.weights, self._stack_features(states),
+                              final_reward, gamma, lambda_, self.lr)
 
     def evaluate(self, features: list[float]) -> float:
         """Compute w . features (dot product)."""
         f = self._align_features(np.array(features, dtype=np.float64))
         return float(np.dot(self.weights, f))
 
+    def _stack_features(self, records: list[dict]) -> np.ndarray:
+        """Stack aligned feature vectors of state records into one (n, F) matrix."""
+        return np.stack([
+            self._align_features(np.array(r['features'], dtype=np.float64))
+            for r in records
+        ])
+
     def _align_features(self, features: np.ndarray) -> np.ndarray:
         """Pad or truncate features to match weight vector length."""
         n = len(self.weights)
@@ -427,13 +494,11 @@ class LinearTrainer:
     def save_weights(self, path: str) -> None:
         """Save weights as JSON array (compatible with PHP LearningAICoach)."""
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            json.dump(self.weights.tolist(), f)
+        _dump_weights_json(self.weights, path)
 
     def load_weights(self, path: str) -> None:
         """Load weights from JSON array, padding with zeros if feature count increased."""
-        with open(path) as f:
-            data = json.load(f)
+        data = _parse_weights_json(path)
         loaded = np.array(data, dtype=np.float64)
         if len(loaded) < len(self.weights):
             # Pad with zeros for new features
@@ -911,18 +976,16 @@ class NeuralTrainer:
             'type': 'neural',
             'hidden_size': self.hidden_size,
             'n_features': self.n_features,
-            'W1': self.W1.tolist(),
-            'b1': self.b1.tolist(),
-            'W2': self.W2.tolist(),
-            'b2': self.b2.tolist(),
+            'W1': self.W1,
+            'b1': self.b1,
+            'W2': self.W2,
+            'b2': self.b2,
         }
-        with open(path, 'w') as f:
-            json.dump(data, f)
+        _dump_weights_json(data, path)
 
     def load_weights(self, path: str) -> None:
         """Load neural network weights from JSON."""
-        with open(path) as f:
-            data = json.load(f)
+        data = _parse_weights_json(path)
         if isinstance(data, dict) and data.get('type') == 'neural':
             self.W1 = np.array(data['W1'], dtype=np.float64)
             self.b1 = np.array(data['b1'], dtype=np.float64)
@@ -986,10 +1049,29 @@ def _expand_value_W1(W1: np.ndarray, target_n_features: int) -> np.ndarray:
     return np.vstack([W1, pad])
 
 
+# Parsed-weights cache keyed by (resolved path, mtime): pipeline stages that
+# share a process (run_training -> benchmark -> gating in run_iteration.py)
+# re-open the same weights.json several times per epoch; the JSON parse is the
+# expensive part, so cache the parsed data and rebuild a FRESH trainer from it
+# on every call (trainers are mutated in place by training, sharing instances
+# would be unsafe). A re-save bumps the mtime and invalidates the entry.
+_weights_json_cache: dict = {}
+
+
+def _load_weights_json(path: str):
+    """Read + parse a weights JSON file, cached by (path, mtime)."""
+    resolved = str(Path(path).resolve())
+    mtime = Path(resolved).stat().st_mtime_ns
+    key = (resolved, mtime)
+    if key not in _weights_json_cache:
+        _weights_json_cache.clear()  # one live entry per process is enough
+        _weights_json_cache[key] = _parse_weights_json(resolved)
+    return _weights_json_cache[key]
+
+
 def load_trainer(path: str, learning_rate: float = 0.01) -> Union[LinearTrainer, NeuralTrainer]:
     """Auto-detect weight format and return the appropriate trainer."""
-    with open(path) as f:
-        data = json.load(f)
+    data = _load_weights_json(path)
 
     if isinstance(data, dict) and data.get('type') == 'neural':
         n_features = data.get('n_features', len(data['W1']))
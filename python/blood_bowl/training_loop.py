@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import csv
 import json
+import os
 import shutil
 import sys
 import time
@@ -205,10 +206,14 @@ def run_training(
     replay_buffer = None
     if replay_buffer_size > 0:
         from .replay_buffer import ReplayBuffer
-        replay_buffer = ReplayBuffer(capacity=replay_buffer_size)
-        replay_path = root / 'replay_buffer.pkl'
-        if replay_path.exists():
-            replay_buffer.load(str(replay_path))
+        # Disk-backed storage: transitions live in float32 memmaps under
+        # replay_buffer/ and persist across runs without the pickle round-trip.
+        replay_buffer = ReplayBuffer(capacity=replay_buffer_size,
+                                     memmap_dir=str(root / 'replay_buffer'))
+        legacy_path = root / 'replay_buffer.pkl'
+        if len(replay_buffer) == 0 and legacy_path.exists():
+            replay_buffer.load(str(legacy_path))  # one-time pickle migration
+        if len(replay_buffer) > 0:
             print(f'Replay buffer: loaded {len(replay_buffer)} transitions, capacity={replay_buffer_size}')
         else:
             print(f'Replay buffer: new, capacity={replay_buffer_size}, batch={replay_batch_size}')
@@ -401,8 +406,8 @@ def run_training(
                 _train_on_transition(trainer, transition, training_method, gamma, lambda_,
                                      td_mix_alpha=td_mix_alpha)
 
-            # Save replay buffer periodically
-            replay_buffer.save(str(root / 'replay_buffer.pkl'))
+            # Sync the memmap store periodically (no pickle rewrite needed)
+            replay_buffer.flush()
 
         # Observability: weight norm change + grad norm
         w_norm_after = _weight_norm(trainer)
@@ -660,13 +665,16 @@ def run_training(
                         pass
                 # Always store benchmark result in sidecar metadata file (for gating)
                 # Cannot write to weights_path directly as LinearTrainer saves plain list
+                # Atomic tmp+rename so a reader (run_iteration gating) never
+                # sees a half-written meta file.
                 meta_path = weights_path.parent / (weights_path.stem + '_meta.json')
-                with open(meta_path, 'w') as f:
-                    json.dump({
-                        'benchmark_win_rate': bm_wr,
-                        'benchmark_epoch': epoch,
-                        'benchmark_mcts_iterations': mcts_iterations,
-                    }, f)
+                tmp_path = meta_path.with_suffix('.json.tmp')
+                tmp_path.write_text(json.dumps({
+                    'benchmark_win_rate': bm_wr,
+                    'benchmark_epoch': epoch,
+                    'benchmark_mcts_iterations': mcts_iterations,
+                }))
+                os.replace(tmp_path, meta_path)
 
                 # Best-tracking and auto-revert are standalone-only: when an
                 # external orchestrator (run_iteration.py) owns weights_best.json,
@@ -735,6 +743,12 @@ def run_training(
                 print(f'  Stopping training. Review strategy before restarting.')
                 break
 
+    # One pickle export per run (not per epoch): run_iteration.py archives
+    # replay_buffer.pkl after each iteration, so it has to reflect the memmap
+    # store's current contents, not the pre-migration legacy file.
+    if replay_buffer is not None and len(replay_buffer) > 0:
+        replay_buffer.save(str(root / 'replay_buffer.pkl'))
+
     total_time = time.time() - training_start
     mins, secs = divmod(int(total_time), 60)
     hours, mins = divmod(mins, 60)
@@ -861,20 +875,36 @@ def _git_push_weights_best(best_path: Path, win_rate: float, score_diff: float,
     pass
 
 
-def _append_benchmark_csv(csv_path: Path, epoch: int, results: dict) -> None:
-    """Append benchmark results to CSV."""
+# Row layout for benchmark results as a structured array — contiguous
+# columns instead of a dict-of-dicts of boxed floats.
+BENCHMARK_DTYPE = np.dtype([
+    ('opponent', 'U16'),
+    ('win_rate', 'f4'),
+    ('avg_score_diff', 'f4'),
+    ('matches', 'i4'),
+])
+
+
+def _append_benchmark_csv(csv_path: Path, epoch: int, results) -> None:
+    """Append benchmark results to CSV.
+
+    `results` is either the legacy dict-of-dicts keyed by opponent name or
+    a structured ndarray with BENCHMARK_DTYPE fields.
+    """
+    if isinstance(results, np.ndarray):
+        rows = results.tolist()
+    else:
+        rows = [(opp, stats['win_rate'], stats['avg_score_diff'], stats['matches'])
+                for opp, stats in results.items()]
     write_header = not csv_path.exists()
-    with open(csv_path, 'a', newline='') as f:
+    with open(csv_path, 'a', newline='', buffering=65536) as f:
         writer = csv.writer(f)
         if write_header:
             writer.writerow(['epoch', 'opponent', 'win_rate', 'avg_score_diff', 'matches'])
-        for opp_name, stats in results.items():
-            writer.writerow([
-                epoch, opp_name,
-                f'{stats["win_rate"]:.3f}',
-                f'{stats["avg_score_diff"]:.2f}',
-                stats['matches'],
-            ])
+        writer.writerows(
+            (epoch, opp, f'{wr:.3f}', f'{sd:.2f}', matches)
+            for opp, wr, sd, matches in rows
+        )
 
 
 def _check_regression(bench_csv: Path, current_epoch: int, current_results: dict) -> None:
@@ -904,15 +934,18 @@ def _check_regression(bench_csv: Path, current_epoch: int, current_results: dict
                 print(f'  REGRESSION vs {opp}: {current:.1%} (was {best:.1%}, drop {best - current:.1%})')
 
 
-def _read_jsonl(path: Path) -> list[dict]:
-    """Read a JSONL file into a list of dicts."""
-    records = []
+def _read_jsonl_iter(path: Path):
+    """Yield records from a JSONL file one at a time (O(1) peak memory)."""
     with open(path) as f:
         for line in f:
             line = line.strip()
             if line:
-                records.append(json.loads(line))
-    return records
+                yield json.loads(line)
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    """Read a JSONL file into a list of dicts."""
+    return list(_read_jsonl_iter(path))
 
 
 def _weight_norm(trainer) -> float:
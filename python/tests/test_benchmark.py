@@ -4,7 +4,6 @@ from __future__ import annotations
 import csv
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,16 +11,16 @@ from blood_bowl.benchmark import run_benchmark
 from blood_bowl.cli_runner import MatchResult, TournamentResult
 
 
+# MatchResult is frozen, so sharing one instance per outcome is safe
+_HOME_WIN = MatchResult(home_score=2, away_score=1, total_actions=100, phase='game', half=2)
+_AWAY_WIN = MatchResult(home_score=0, away_score=1, total_actions=100, phase='game', half=2)
+_DRAW = MatchResult(home_score=1, away_score=1, total_actions=100, phase='game', half=2)
+
+
 def _mock_tournament_result(home_wins: int, away_wins: int, draws: int) -> TournamentResult:
     """Create a mock TournamentResult."""
     total = home_wins + away_wins + draws
-    results = []
-    for _ in range(home_wins):
-        results.append(MatchResult(home_score=2, away_score=1, total_actions=100, phase='game', half=2))
-    for _ in range(away_wins):
-        results.append(MatchResult(home_score=0, away_score=1, total_actions=100, phase='game', half=2))
-    for _ in range(draws):
-        results.append(MatchResult(home_score=1, away_score=1, total_actions=100, phase='game', half=2))
+    results = [_HOME_WIN] * home_wins + [_AWAY_WIN] * away_wins + [_DRAW] * draws
     return TournamentResult(
         home_ai='learning',
         away_ai='random',
@@ -33,12 +32,40 @@ def _mock_tournament_result(home_wins: int, away_wins: int, draws: int) -> Tourn
     )
 
 
+class _StubRunner:
+    """Minimal CLIRunner stand-in — a plain method call instead of MagicMock
+    attribute machinery. Class attrs configure the next instance; the last
+    created instance is kept so tests can inspect captured simulate kwargs.
+    """
+    result: TournamentResult | None = None
+    error: Exception | None = None
+    last_instance: '_StubRunner | None' = None
+
+    def __init__(self, *args, **kwargs):
+        self.last_kwargs: dict = {}
+        type(self).last_instance = self
+
+    def simulate(self, **kwargs):
+        self.last_kwargs = kwargs
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def stub_runner(monkeypatch):
+    # Reset class-level state per test: keeps tests order-independent and
+    # safe to shard under pytest-xdist (no cross-test mock state).
+    _StubRunner.result = None
+    _StubRunner.error = None
+    _StubRunner.last_instance = None
+    monkeypatch.setattr('blood_bowl.benchmark.CLIRunner', _StubRunner)
+    return _StubRunner
+
+
 class TestRunBenchmark:
-    @patch('blood_bowl.benchmark.CLIRunner')
-    def test_returns_results_for_each_opponent(self, mock_runner_cls):
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_runner.simulate.return_value = _mock_tournament_result(3, 1, 1)
+    def test_returns_results_for_each_opponent(self, stub_runner):
+        stub_runner.result = _mock_tournament_result(3, 1, 1)
 
         results = run_benchmark(
             weights_file='weights.json',
@@ -52,11 +79,8 @@ class TestRunBenchmark:
         assert results['random']['matches'] == 5
         assert results['random']['win_rate'] == 0.6
 
-    @patch('blood_bowl.benchmark.CLIRunner')
-    def test_win_rate_calculation(self, mock_runner_cls):
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_runner.simulate.return_value = _mock_tournament_result(5, 0, 0)
+    def test_win_rate_calculation(self, stub_runner):
+        stub_runner.result = _mock_tournament_result(5, 0, 0)
 
         results = run_benchmark(
             weights_file='w.json',
@@ -68,12 +92,9 @@ class TestRunBenchmark:
         assert results['random']['win_rate'] == 1.0
         assert results['random']['avg_score_diff'] == 1.0
 
-    @patch('blood_bowl.benchmark.CLIRunner')
-    def test_score_diff_calculation(self, mock_runner_cls):
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
+    def test_score_diff_calculation(self, stub_runner):
         # 3 wins (2-1) + 2 losses (0-1) = avg diff = (3*1 + 2*(-1))/5 = 0.2
-        mock_runner.simulate.return_value = _mock_tournament_result(3, 2, 0)
+        stub_runner.result = _mock_tournament_result(3, 2, 0)
 
         results = run_benchmark(
             weights_file='w.json',
@@ -82,13 +103,10 @@ class TestRunBenchmark:
             use_cpp=False,
         )
 
-        assert abs(results['random']['avg_score_diff'] - 0.2) < 0.01
+        assert results['random']['avg_score_diff'] == pytest.approx(0.2, abs=0.01)
 
-    @patch('blood_bowl.benchmark.CLIRunner')
-    def test_handles_simulate_failure(self, mock_runner_cls):
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_runner.simulate.side_effect = RuntimeError('timeout')
+    def test_handles_simulate_failure(self, stub_runner):
+        stub_runner.error = RuntimeError('timeout')
 
         results = run_benchmark(
             weights_file='w.json',
@@ -100,12 +118,9 @@ class TestRunBenchmark:
         assert results['random']['win_rate'] == 0.0
         assert results['random']['matches'] == 0
 
-    @patch('blood_bowl.benchmark.CLIRunner')
-    def test_uses_epsilon_zero(self, mock_runner_cls):
+    def test_uses_epsilon_zero(self, stub_runner):
         """Benchmark should use epsilon=0 (greedy evaluation)."""
-        mock_runner = MagicMock()
-        mock_runner_cls.return_value = mock_runner
-        mock_runner.simulate.return_value = _mock_tournament_result(1, 0, 0)
+        stub_runner.result = _mock_tournament_result(1, 0, 0)
 
         run_benchmark(
             weights_file='w.json',
@@ -114,5 +129,4 @@ class TestRunBenchmark:
             use_cpp=False,
         )
 
-        call_kwargs = mock_runner.simulate.call_args[1]
-        assert call_kwargs['epsilon'] == 0.0
+        assert stub_runner.last_instance.last_kwargs['epsilon'] == 0.0
@@ -1,25 +1,24 @@
 """Tests for the CLI runner."""
 import pytest
+from functools import lru_cache
 from pathlib import Path
 from blood_bowl.cli_runner import CLIRunner, MatchResult
 
 
+@lru_cache(maxsize=1)
 def get_project_root():
     return str(Path(__file__).parent.parent.parent)
 
 
 class TestMatchResult:
-    def test_winner_home(self):
-        r = MatchResult(home_score=2, away_score=1, total_actions=100, phase='game_over', half=2)
-        assert r.winner == 'home'
-
-    def test_winner_away(self):
-        r = MatchResult(home_score=0, away_score=1, total_actions=100, phase='game_over', half=2)
-        assert r.winner == 'away'
-
-    def test_winner_draw(self):
-        r = MatchResult(home_score=1, away_score=1, total_actions=100, phase='game_over', half=2)
-        assert r.winner is None
+    @pytest.mark.parametrize('home, away, expected', [
+        (2, 1, 'home'),
+        (0, 1, 'away'),
+        (1, 1, None),
+    ])
+    def test_winner(self, home, away, expected):
+        r = MatchResult(home_score=home, away_score=away, total_actions=100, phase='game_over', half=2)
+        assert r.winner == expected
 
 
 class TestCLIRunner:
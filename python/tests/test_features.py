@@ -1,27 +1,220 @@
 """Tests for feature extraction."""
+import copy
+import hashlib
 import json
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+import numpy as np
+
 from blood_bowl.features import NUM_FEATURES, extract_features
 
+# Resolved once at import — a which() PATH search per run adds up
+HAS_PHP = shutil.which('php') is not None
+
 
+@lru_cache(maxsize=1)
 def get_project_root():
     return str(Path(__file__).parent.parent.parent)
 
 
+@pytest.fixture
+def simple_state():
+    """Fresh copy of the reference state; mutate freely."""
+    return copy.deepcopy(_FROZEN_TEMPLATE)
+
+
+_FEATURE_SERVER = Path(get_project_root()) / 'cli' / 'feature_server.php'
+
+
+@pytest.fixture(scope='session')
+def php_feature_server():
+    """Persistent PHP feature-extraction worker (JSON lines over pipes).
+
+    PHP startup + autoload is paid once per session; requests are served
+    over stdin/stdout. Yields a send(request_dict) -> response_dict callable.
+    The worker script is committed at cli/feature_server.php — nothing is
+    written to or deleted from cli/ at test time, and opcache can warm the
+    same file across runs.
+    """
+    if not HAS_PHP or not os.environ.get('BBOWL_PHP_TESTS'):
+        pytest.skip('set BBOWL_PHP_TESTS=1 and have php on PATH')
+
+    proc = subprocess.Popen(
+        ['php', str(_FEATURE_SERVER)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        cwd=get_project_root(),
+    )
+
+    def send(request: dict) -> dict:
+        proc.stdin.write(json.dumps(request) + '\n')
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        if not line:
+            pytest.skip('PHP feature server exited unexpectedly')
+        response = json.loads(line)
+        if 'error' in response:
+            pytest.skip(f'PHP feature server error: {response["error"]}')
+        return response
+
+    yield send
+    proc.stdin.close()
+    proc.wait(timeout=10)
+
+
+def _php_sources_digest() -> str:
+    """Hash every PHP source the feature worker's output depends on.
+
+    Not just cli/feature_server.php: the extraction logic lives in
+    src/AI/FeatureExtractor.php and the DTO/ValueObject classes it consumes
+    via the autoloader. Keying the cache on the worker script alone would
+    freeze a stale snapshot across extractor regressions.
+    """
+    root = Path(get_project_root())
+    sources = [_FEATURE_SERVER, root / 'src' / 'AI' / 'FeatureExtractor.php']
+    sources += sorted((root / 'src' / 'DTO').glob('*.php'))
+    sources += sorted((root / 'src' / 'ValueObject').glob('*.php'))
+    h = hashlib.sha256()
+    for src in sources:
+        h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+@pytest.fixture(scope='session')
+def php_feature_reference(request):
+    """PHP FeatureExtractor output for the reference state, cached on disk.
+
+    The PHP output is deterministic given the PHP sources, so the parsed
+    JSON is persisted in pytest's cache directory keyed by a hash of the
+    worker script plus the extractor and DTO/ValueObject sources — the
+    worker only spawns when any of them changes.
+    """
+    if not HAS_PHP or not os.environ.get('BBOWL_PHP_TESTS'):
+        pytest.skip('set BBOWL_PHP_TESTS=1 and have php on PATH')
+
+    key = _php_sources_digest()
+    cache_dir = request.config.cache.mkdir('php_features')
+    cache_file = cache_dir / f'{key}.json'
+    if cache_file.exists():
+        return json.loads(cache_file.read_text())
+
+    send = request.getfixturevalue('php_feature_server')
+    data = send({'cmd': 'reference'})
+
+    cache_file.write_text(json.dumps(data))
+    return data
+
+
+def _mut_sideline(state):
+    # Move player 1 to sideline Y=0
+    state['players'][0]['position'] = {'x': 10, 'y': 0}
+
+
+def _mut_stall_incentive(state):
+    # HOME carrier at x=23 (near endzone for HOME: dist=2), ahead 1-0, turn 1
+    state['players'][0]['position'] = {'x': 23, 'y': 7}
+    state['ball'] = {'position': {'x': 23, 'y': 7}, 'isHeld': True, 'carrierId': 1}
+    state['homeTeam']['score'] = 1
+    state['homeTeam']['turnNumber'] = 1
+    state['awayTeam']['score'] = 0
+
+
+def _mut_carrier_tz(state):
+    # HOME carrier at (10,7), AWAY adjacent at (11,7) and (10,8)
+    state['players'] = [
+        {'id': 1, 'teamSide': 'home', 'state': 'standing',
+         'position': {'x': 10, 'y': 7},
+         'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
+        {'id': 2, 'teamSide': 'away', 'state': 'standing',
+         'position': {'x': 11, 'y': 7},
+         'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
+        {'id': 3, 'teamSide': 'away', 'state': 'standing',
+         'position': {'x': 10, 'y': 8},
+         'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
+    ]
+    state['ball'] = {'position': {'x': 10, 'y': 7}, 'isHeld': True, 'carrierId': 1}
+
+
+def _mut_scoring_threat(state):
+    # HOME carrier at x=22, MA=6 -> dist to endzone (25) = 3, MA(6) >= 3 -> threat
+    state['players'][0]['position'] = {'x': 22, 'y': 7}
+    state['players'][0]['stats']['movement'] = 6
+    state['ball'] = {'position': {'x': 22, 'y': 7}, 'isHeld': True, 'carrierId': 1}
+
+
+def _mut_scoring_threat_short(state):
+    # HOME carrier at x=10, MA=6 -> dist to endzone = 15, MA(6) < 15 -> no threat
+    state['players'][0]['stats']['movement'] = 6
+    state['ball'] = {'position': {'x': 10, 'y': 7}, 'isHeld': True, 'carrierId': 1}
+
+
+def _mut_opp_scoring_threat(state):
+    # AWAY carrier at x=3, MA=6 -> dist to AWAY endzone (0) = 3, MA(6) >= 3 -> threat
+    state['players'][1]['position'] = {'x': 3, 'y': 7}
+    state['players'][1]['stats']['movement'] = 6
+    state['ball'] = {'position': {'x': 3, 'y': 7}, 'isHeld': True, 'carrierId': 2}
+
+
+def _mut_engaged(state):
+    # Move away player adjacent to home player
+    state['players'][1]['position'] = {'x': 11, 'y': 7}
+
+
+def _mut_not_engaged(state):
+    # HOME at (5,7), AWAY at (20,7) -> far apart, not engaged
+    state['players'][0]['position'] = {'x': 5, 'y': 7}
+    state['players'][1]['position'] = {'x': 20, 'y': 7}
+    state['ball'] = {'position': {'x': 5, 'y': 7}, 'isHeld': True, 'carrierId': 1}
+
+
+def _mut_prone_stunned(state):
+    state['players'].append(
+        {'id': 3, 'teamSide': 'home', 'state': 'prone',
+         'position': {'x': 8, 'y': 7},
+         'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
+    )
+    state['players'].append(
+        {'id': 4, 'teamSide': 'away', 'state': 'stunned',
+         'position': {'x': 18, 'y': 7},
+         'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
+    )
+
+
+# (mutator, {feature index: expected value}) — one parametrized test node
+# instead of a dozen near-identical methods. Expected values documented at
+# the mutators above; stall_incentive = turns_remaining * 1.5 when leading.
+_MUTATION_CASES = [
+    pytest.param(_mut_sideline, {30: 1.0, 31: 0.0}, id='sideline'),
+    pytest.param(_mut_stall_incentive, {34: 1.0, 33: 0.5, 32: 1.0, 35: 1.5},
+                 id='stall_incentive'),
+    pytest.param(_mut_carrier_tz, {40: 0.5}, id='carrier_tz_count'),
+    pytest.param(_mut_scoring_threat, {41: 1.0}, id='scoring_threat'),
+    pytest.param(_mut_scoring_threat_short, {41: 0.0},
+                 id='scoring_threat_not_enough_movement'),
+    pytest.param(_mut_opp_scoring_threat, {42: 1.0}, id='opp_scoring_threat'),
+    pytest.param(_mut_engaged, {43: 1.0, 44: 1.0}, id='engaged_fractions'),
+    pytest.param(_mut_not_engaged, {43: 0.0, 44: 0.0},
+                 id='engaged_fractions_no_contact'),
+    pytest.param(_mut_prone_stunned, {45: 1.0 / 11.0, 46: 1.0 / 11.0},
+                 id='prone_stunned'),
+    pytest.param(_mut_not_engaged, {47: 1.0 / 11.0}, id='free_players'),
+]
+
+
 class TestFeatureExtractor:
-    def test_output_has_correct_feature_count(self):
-        state = _make_simple_state()
+    def test_output_has_correct_feature_count(self, simple_state):
+        state = simple_state
         features = extract_features(state, 'home')
         assert len(features) == NUM_FEATURES
         assert NUM_FEATURES == 73
 
-    def test_bias_is_always_one(self):
-        state = _make_simple_state()
+    def test_bias_is_always_one(self, simple_state):
+        state = simple_state
         home_feat = extract_features(state, 'home')
         away_feat = extract_features(state, 'away')
         assert home_feat[29] == 1.0
@@ -49,224 +242,62 @@ class TestFeatureExtractor:
         # weather_nice
         assert features[24] == 1.0
 
-    @pytest.mark.skipif(shutil.which('php') is None,
-                        reason='php binary not available in this environment')
-    def test_cross_validation_with_php(self):
-        """Run PHP FeatureExtractor via CLI and compare with Python version."""
-        project_root = get_project_root()
-        php_script = Path(project_root) / 'cli' / 'extract_features.php'
-
-        # Create a minimal PHP script for cross-validation
-        php_code = '''<?php
-require_once __DIR__ . '/../vendor/autoload.php';
-use App\\AI\\FeatureExtractor;
-use App\\DTO\\GameState;
-use App\\DTO\\TeamStateDTO;
-use App\\DTO\\MatchPlayerDTO;
-use App\\DTO\\BallState;
-use App\\Enum\\TeamSide;
-use App\\Enum\\PlayerState;
-use App\\Enum\\GamePhase;
-use App\\Enum\\Weather;
-use App\\ValueObject\\PlayerStats;
-use App\\ValueObject\\Position;
-
-// Build a test state
-$homeTeam = TeamStateDTO::create(1, 'Home', 'Human', TeamSide::HOME, 3)->withScore(1);
-$awayTeam = TeamStateDTO::create(2, 'Away', 'Orc', TeamSide::AWAY, 2);
-
-$p1 = MatchPlayerDTO::create(1, 1, 'P1', 1, 'Blitzer', new PlayerStats(6, 3, 3, 8), [], TeamSide::HOME, new Position(10, 7));
-$p2 = MatchPlayerDTO::create(2, 2, 'P2', 2, 'Lineman', new PlayerStats(6, 3, 3, 8), [], TeamSide::AWAY, new Position(15, 7));
-
-$state = new GameState(
-    matchId: 1, half: 1, phase: GamePhase::PLAY, activeTeam: TeamSide::HOME,
-    homeTeam: $homeTeam, awayTeam: $awayTeam,
-    players: [1 => $p1, 2 => $p2],
-    ball: BallState::carried(new Position(10, 7), 1),
-    turnoverPending: false, kickingTeam: TeamSide::AWAY, weather: Weather::NICE,
-);
-
-$features = FeatureExtractor::extract($state, TeamSide::HOME);
-echo json_encode(['features' => $features, 'state' => $state->toArray()]);
-'''
-        php_script.write_text(php_code)
-        try:
-            result = subprocess.run(
-                ['php', str(php_script)],
-                capture_output=True, text=True, timeout=10,
-                cwd=project_root,
-            )
-            if result.returncode != 0:
-                pytest.skip(f'PHP execution failed: {result.stderr}')
-
-            data = json.loads(result.stdout)
-            php_features = data['features']
-            state_dict = data['state']
-
-            # Now extract with Python
-            py_features = extract_features(state_dict, 'home')
-
-            assert len(php_features) == len(py_features)
-            for i, (php_val, py_val) in enumerate(zip(php_features, py_features)):
-                assert abs(php_val - py_val) < 0.001, \
-                    f'Feature {i}: PHP={php_val}, Python={py_val}'
-        finally:
-            php_script.unlink(missing_ok=True)
-
-
-    def test_sideline_features(self):
-        state = _make_simple_state()
-        # Move player 1 to sideline Y=0
-        state['players'][0]['position'] = {'x': 10, 'y': 0}
-        features = extract_features(state, 'home')
-
-        # 1 of 1 home standing on sideline → 1.0
-        assert abs(features[30] - 1.0) < 0.001
-        # opp not on sideline → 0.0
-        assert abs(features[31] - 0.0) < 0.001
-
-    def test_stall_incentive_features(self):
-        state = _make_simple_state()
-        # HOME carrier at x=23 (near endzone for HOME: dist=2), ahead 1-0, turn 1
-        state['players'][0]['position'] = {'x': 23, 'y': 7}
-        state['ball'] = {'position': {'x': 23, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        state['homeTeam']['score'] = 1
-        state['homeTeam']['turnNumber'] = 1
-        state['awayTeam']['score'] = 0
-        features = extract_features(state, 'home')
-
-        # carrier_near_endzone = 1.0 (dist=2 <= 3)
-        assert abs(features[34] - 1.0) < 0.001
-        # score_advantage_with_ball = (1+1)/4 = 0.5
-        assert abs(features[33] - 0.5) < 0.001
-        # turns_remaining = (9-1)/8 = 1.0
-        assert abs(features[32] - 1.0) < 0.001
-        # stall_incentive = turns_remaining (1.0); leading -> *1.5 = 1.5
-        # (matches features.py; test previously asserted a stale 0.5 formula).
-        assert abs(features[35] - 1.5) < 0.001
-
-    def test_carrier_tz_count(self):
-        state = _make_simple_state()
-        # HOME carrier at (10,7), AWAY adjacent at (11,7) and (10,8)
-        state['players'] = [
-            {'id': 1, 'teamSide': 'home', 'state': 'standing',
-             'position': {'x': 10, 'y': 7},
-             'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
-            {'id': 2, 'teamSide': 'away', 'state': 'standing',
-             'position': {'x': 11, 'y': 7},
-             'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
-            {'id': 3, 'teamSide': 'away', 'state': 'standing',
-             'position': {'x': 10, 'y': 8},
-             'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
-        ]
-        state['ball'] = {'position': {'x': 10, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        features = extract_features(state, 'home')
-        # 2 opp adjacent → 2/4 = 0.5
-        assert abs(features[40] - 0.5) < 0.001
-
-    def test_scoring_threat(self):
-        state = _make_simple_state()
-        # HOME carrier at x=22, MA=6 → dist to endzone (25) = 3, MA(6) >= 3 → threat
-        state['players'][0]['position'] = {'x': 22, 'y': 7}
-        state['players'][0]['stats']['movement'] = 6
-        state['ball'] = {'position': {'x': 22, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        features = extract_features(state, 'home')
-        assert abs(features[41] - 1.0) < 0.001
-
-    def test_scoring_threat_not_enough_movement(self):
-        state = _make_simple_state()
-        # HOME carrier at x=10, MA=6 → dist to endzone = 15, MA(6) < 15 → no threat
-        state['players'][0]['stats']['movement'] = 6
-        state['ball'] = {'position': {'x': 10, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        features = extract_features(state, 'home')
-        assert abs(features[41] - 0.0) < 0.001
-
-    def test_opp_scoring_threat(self):
-        state = _make_simple_state()
-        # AWAY carrier at x=3, MA=6 → dist to AWAY endzone (0) = 3, MA(6) >= 3 → threat
-        state['players'][1]['position'] = {'x': 3, 'y': 7}
-        state['players'][1]['stats']['movement'] = 6
-        state['ball'] = {'position': {'x': 3, 'y': 7}, 'isHeld': True, 'carrierId': 2}
-        features = extract_features(state, 'home')
-        assert abs(features[42] - 1.0) < 0.001
-
-    def test_engaged_fractions(self):
-        state = _make_simple_state()
-        # Move away player adjacent to home player
-        state['players'][1]['position'] = {'x': 11, 'y': 7}
-        features = extract_features(state, 'home')
-        # Only 1 home standing, 1 away standing, both adjacent
-        assert abs(features[43] - 1.0) < 0.001  # my_engaged_fraction
-        assert abs(features[44] - 1.0) < 0.001  # opp_engaged_fraction
-
-    def test_engaged_fractions_no_contact(self):
-        state = _make_simple_state()
-        # HOME at (5,7), AWAY at (20,7) → far apart, not engaged
-        state['players'][0]['position'] = {'x': 5, 'y': 7}
-        state['players'][1]['position'] = {'x': 20, 'y': 7}
-        state['ball'] = {'position': {'x': 5, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        features = extract_features(state, 'home')
-        assert abs(features[43] - 0.0) < 0.001  # my_engaged_fraction
-        assert abs(features[44] - 0.0) < 0.001  # opp_engaged_fraction
-
-    def test_prone_stunned_features(self):
-        state = _make_simple_state()
-        state['players'].append(
-            {'id': 3, 'teamSide': 'home', 'state': 'prone',
-             'position': {'x': 8, 'y': 7},
-             'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
-        )
-        state['players'].append(
-            {'id': 4, 'teamSide': 'away', 'state': 'stunned',
-             'position': {'x': 18, 'y': 7},
-             'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8}},
-        )
-        features = extract_features(state, 'home')
-        # 1 prone home / 11 ≈ 0.0909
-        assert abs(features[45] - 1.0 / 11.0) < 0.001
-        # 1 stunned away / 11 ≈ 0.0909
-        assert abs(features[46] - 1.0 / 11.0) < 0.001
-
-    def test_free_players_feature(self):
-        state = _make_simple_state()
-        # HOME at (5,7), AWAY at (20,7) → not engaged → 1 free
-        state['players'][0]['position'] = {'x': 5, 'y': 7}
-        state['players'][1]['position'] = {'x': 20, 'y': 7}
-        state['ball'] = {'position': {'x': 5, 'y': 7}, 'isHeld': True, 'carrierId': 1}
-        features = extract_features(state, 'home')
-        # 1 standing, 0 engaged → 1 free / 11 ≈ 0.0909
-        assert abs(features[47] - 1.0 / 11.0) < 0.001
-
-
-def _make_simple_state() -> dict:
-    return {
-        'half': 1,
-        'activeTeam': 'home',
-        'homeTeam': {
-            'score': 1, 'rerolls': 3, 'turnNumber': 3,
-            'blitzUsedThisTurn': False, 'passUsedThisTurn': False,
-        },
-        'awayTeam': {
-            'score': 0, 'rerolls': 2, 'turnNumber': 3,
-            'blitzUsedThisTurn': False, 'passUsedThisTurn': False,
-        },
-        'players': [
-            {
-                'id': 1, 'teamSide': 'home', 'state': 'standing',
-                'position': {'x': 10, 'y': 7},
-                'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8},
-            },
-            {
-                'id': 2, 'teamSide': 'away', 'state': 'standing',
-                'position': {'x': 15, 'y': 7},
-                'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8},
-            },
-        ],
-        'ball': {
+    def test_cross_validation_with_php(self, php_feature_reference):
+        """Compare cached PHP FeatureExtractor output with the Python version."""
+        php_features = php_feature_reference['features']
+        state_dict = php_feature_reference['state']
+
+        py_features = extract_features(state_dict, 'home')
+
+        assert len(php_features) == len(py_features)
+        np.testing.assert_allclose(np.asarray(py_features),
+                                   np.asarray(php_features), atol=1e-3)
+
+
+    @pytest.mark.parametrize('mutator,expected', _MUTATION_CASES)
+    def test_feature_mutations(self, simple_state, mutator, expected):
+        """Single parametrized node for the mutate-state-then-check tests."""
+        mutator(simple_state)
+        features = np.asarray(extract_features(simple_state, 'home'))
+        indices = list(expected)
+        np.testing.assert_allclose(features[indices],
+                                   [expected[i] for i in indices], atol=1e-3)
+
+
+# Built once at import; tests get a deepcopy via the simple_state fixture so
+# per-test mutations never leak between tests.
+#
+# Deliberately a plain dict, not a GameState dataclass: extract_features
+# consumes the GameState::toArray() wire format and must keep matching the
+# PHP extractor byte for byte — these tests exercise exactly that dict path.
+_FROZEN_TEMPLATE: dict = {
+    'half': 1,
+    'activeTeam': 'home',
+    'homeTeam': {
+        'score': 1, 'rerolls': 3, 'turnNumber': 3,
+        'blitzUsedThisTurn': False, 'passUsedThisTurn': False,
+    },
+    'awayTeam': {
+        'score': 0, 'rerolls': 2, 'turnNumber': 3,
+        'blitzUsedThisTurn': False, 'passUsedThisTurn': False,
+    },
+    'players': [
+        {
+            'id': 1, 'teamSide': 'home', 'state': 'standing',
             'position': {'x': 10, 'y': 7},
-            'isHeld': True,
-            'carrierId': 1,
+            'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8},
+        },
+        {
+            'id': 2, 'teamSide': 'away', 'state': 'standing',
+            'position': {'x': 15, 'y': 7},
+            'stats': {'movement': 6, 'strength': 3, 'agility': 3, 'armour': 8},
         },
-        'weather': 'nice',
-        'kickingTeam': 'away',
-    }
+    ],
+    'ball': {
+        'position': {'x': 10, 'y': 7},
+        'isHeld': True,
+        'carrierId': 1,
+    },
+    'weather': 'nice',
+    'kickingTeam': 'away',
+}
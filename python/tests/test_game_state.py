@@ -45,10 +45,14 @@ def make_sample_state():
     }
 
 
-def test_game_state_from_dict():
-    data = make_sample_state()
-    state = GameState.from_dict(data)
+@pytest.fixture(scope='module')
+def sample_state():
+    """Parsed sample state, built once — all consumers are read-only."""
+    return GameState.from_dict(make_sample_state())
 
+
+def test_game_state_from_dict(sample_state):
+    state = sample_state
     assert state.match_id == 1
     assert state.phase == 'play'
     assert state.active_team == 'home'
@@ -56,20 +60,16 @@ def test_game_state_from_dict():
     assert state.ai_team == 'away'
 
 
-def test_team_state():
-    data = make_sample_state()
-    state = GameState.from_dict(data)
-
+def test_team_state(sample_state):
+    state = sample_state
     assert state.home_team.name == 'Home FC'
     assert state.home_team.race_name == 'Human'
     assert state.home_team.rerolls == 3
     assert state.away_team.name == 'Away Utd'
 
 
-def test_players():
-    data = make_sample_state()
-    state = GameState.from_dict(data)
-
+def test_players(sample_state):
+    state = sample_state
     assert len(state.players) == 2
     p1 = state.players[0]
     assert p1.name == 'Player 1'
@@ -78,19 +78,15 @@ def test_players():
     assert 'Block' in p1.skills
 
 
-def test_ball_state():
-    data = make_sample_state()
-    state = GameState.from_dict(data)
-
+def test_ball_state(sample_state):
+    state = sample_state
     assert state.ball.is_held
     assert state.ball.carrier_id == 1
     assert state.ball.position == Position(5, 7)
 
 
-def test_get_team_players():
-    data = make_sample_state()
-    state = GameState.from_dict(data)
-
+def test_get_team_players(sample_state):
+    state = sample_state
     home = state.get_team_players('home')
     assert len(home) == 1
     assert home[0].id == 1
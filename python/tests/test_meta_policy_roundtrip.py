@@ -143,7 +143,7 @@ def push_repo(tmp_path):
 def _fake_git(root: Path, calls: list):
     """Mock subprocess.run: `git reset --hard` simuluje clobber working tree
     na committed (zastaralou) verzi — přesně scénář reálného bugu."""
-    def run(cmd, cwd=None, capture_output=None):
+    def run(cmd, cwd=None, capture_output=None, stdout=None, stderr=None):
         calls.append(list(cmd))
         if cmd[:2] == ['git', 'reset']:
             (root / 'weights_best_meta.json').write_text('{"benchmark_win_rate": 0.5}')
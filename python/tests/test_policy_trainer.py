@@ -1,7 +1,5 @@
 """Tests for PolicyTrainer."""
 import json
-import tempfile
-from pathlib import Path
 
 import numpy as np
 import pytest
@@ -22,13 +20,13 @@ def _make_decision(n_actions=3, seed=42):
     rng = np.random.RandomState(seed)
     state_feats = rng.randn(NUM_FEATURES).tolist()
 
-    visits = []
+    # One (n_actions, F) draw instead of n_actions separate RNG calls
     fractions = rng.dirichlet(np.ones(n_actions))
-    for i in range(n_actions):
-        visits.append({
-            'action_features': rng.randn(NUM_ACTION_FEATURES).tolist(),
-            'visit_fraction': float(fractions[i]),
-        })
+    action_feats = rng.randn(n_actions, NUM_ACTION_FEATURES)
+    visits = [
+        {'action_features': row, 'visit_fraction': frac}
+        for row, frac in zip(action_feats.tolist(), fractions.tolist())
+    ]
 
     return {
         'state_features': state_feats,
@@ -37,6 +35,40 @@ def _make_decision(n_actions=3, seed=42):
     }
 
 
+def _make_decisions(n, n_actions=3, seed=42):
+    """Batch of n synthetic decisions from one generator, drawn vectorized."""
+    rng = np.random.default_rng(seed)
+    state_feats = rng.standard_normal((n, NUM_FEATURES))
+    action_feats = rng.standard_normal((n, n_actions, NUM_ACTION_FEATURES))
+    fractions = rng.dirichlet(np.ones(n_actions), size=n)
+    return [
+        {
+            'state_features': state_feats[k].tolist(),
+            'perspective': 'home',
+            'visits': [
+                {'action_features': row, 'visit_fraction': frac}
+                for row, frac in zip(action_feats[k].tolist(),
+                                     fractions[k].tolist())
+            ],
+        }
+        for k in range(n)
+    ]
+
+
+@pytest.fixture(scope='module')
+def trained_pt():
+    """A PolicyTrainer trained once on a fixed decision set, plus the set.
+
+    Module-scoped: the gradient passes dominate this file's runtime, so tests
+    that only need *a* trained instance share this one. Do not mutate it —
+    tests exercising training dynamics build their own trainer.
+    """
+    pt = PolicyTrainer(learning_rate=0.05)
+    decisions = _make_decisions(5)
+    pt.train_on_decisions(decisions)
+    return pt, decisions
+
+
 class TestPolicyTrainer:
     def test_init(self):
         pt = PolicyTrainer()
@@ -44,13 +76,14 @@ class TestPolicyTrainer:
         assert pt.bias == 0.0
         assert np.all(pt.weights == 0.0)
 
+    @pytest.mark.heavy
     def test_train_reduces_loss(self):
         pt = PolicyTrainer(learning_rate=0.1)
-        decisions = [_make_decision(seed=i) for i in range(10)]
+        decisions = _make_decisions(10)
 
         loss1 = pt.train_on_decisions(decisions)
-        loss2 = pt.train_on_decisions(decisions)
-        loss3 = pt.train_on_decisions(decisions)
+        # Two more passes in one call — decisions are parsed/stacked once
+        loss3 = pt.train_on_decisions(decisions, passes=2)
 
         # Loss should decrease over iterations
         assert loss3 < loss1
@@ -70,94 +103,82 @@ class TestPolicyTrainer:
         # Weights should have changed
         assert not np.allclose(pt.weights, initial_weights)
 
-    def test_save_load_roundtrip(self):
-        pt = PolicyTrainer(learning_rate=0.05)
-        decisions = [_make_decision(seed=i) for i in range(5)]
-        pt.train_on_decisions(decisions)
-
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
-            path = f.name
+    def test_save_load_roundtrip(self, trained_pt, tmp_path):
+        pt, _ = trained_pt
+        path = str(tmp_path / 'weights.json')
 
         pt.save_weights(path)
 
         pt2 = PolicyTrainer()
         pt2.load_weights(path)
 
-        np.testing.assert_allclose(pt.weights, pt2.weights, atol=1e-10)
-        assert abs(pt.bias - pt2.bias) < 1e-10
+        assert np.array_equal(pt.weights, pt2.weights)
+        assert pt.bias == pytest.approx(pt2.bias, abs=1e-10)
 
-        Path(path).unlink()
 
+def _make_linear_vt():
+    vt = LinearTrainer(learning_rate=0.01)
+    vt.weights = np.random.randn(NUM_FEATURES)
+    return vt
 
-class TestCombinedWeights:
-    def test_save_load_linear(self):
-        vt = LinearTrainer(learning_rate=0.01)
-        vt.weights = np.random.randn(NUM_FEATURES)
-        pt = PolicyTrainer(learning_rate=0.02)
-        pt.weights = np.random.randn(POLICY_INPUT_SIZE)
-        pt.bias = 0.5
 
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
-            path = f.name
+def _make_neural_vt():
+    return NeuralTrainer(n_features=NUM_FEATURES, hidden_size=16, learning_rate=0.01)
 
-        save_combined_weights(vt, pt, path)
 
-        vt2, pt2 = load_combined_weights(path, value_lr=0.01, policy_lr=0.02)
+def _check_linear_vt(vt, vt2):
+    assert isinstance(vt2, LinearTrainer)
+    assert np.array_equal(vt.weights, vt2.weights)
+
 
-        assert isinstance(vt2, LinearTrainer)
-        np.testing.assert_allclose(vt.weights, vt2.weights, atol=1e-10)
-        np.testing.assert_allclose(pt.weights, pt2.weights, atol=1e-10)
-        assert abs(pt.bias - pt2.bias) < 1e-10
+def _check_neural_vt(vt, vt2):
+    assert isinstance(vt2, NeuralTrainer)
+    assert np.array_equal(vt.W1, vt2.W1)
+    assert np.array_equal(vt.b1, vt2.b1)
 
-        Path(path).unlink()
 
-    def test_save_load_neural(self):
-        vt = NeuralTrainer(n_features=NUM_FEATURES, hidden_size=16, learning_rate=0.01)
+class TestCombinedWeights:
+    @pytest.mark.parametrize('make_vt, check_vt, bias', [
+        pytest.param(_make_linear_vt, _check_linear_vt, 0.5, id='linear'),
+        pytest.param(_make_neural_vt, _check_neural_vt, -0.3, id='neural'),
+    ])
+    def test_save_load_roundtrip(self, tmp_path, make_vt, check_vt, bias):
+        vt = make_vt()
         pt = PolicyTrainer(learning_rate=0.02)
         pt.weights = np.random.randn(POLICY_INPUT_SIZE)
-        pt.bias = -0.3
-
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
-            path = f.name
+        pt.bias = bias
 
+        path = str(tmp_path / 'weights.json')
         save_combined_weights(vt, pt, path)
 
         vt2, pt2 = load_combined_weights(path, value_lr=0.01, policy_lr=0.02)
 
-        assert isinstance(vt2, NeuralTrainer)
-        np.testing.assert_allclose(vt.W1, vt2.W1, atol=1e-10)
-        np.testing.assert_allclose(vt.b1, vt2.b1, atol=1e-10)
-        np.testing.assert_allclose(pt.weights, pt2.weights, atol=1e-10)
-        assert abs(pt.bias - pt2.bias) < 1e-10
+        check_vt(vt, vt2)
+        assert np.array_equal(pt.weights, pt2.weights)
+        assert pt.bias == pytest.approx(pt2.bias, abs=1e-10)
 
-        Path(path).unlink()
-
-    def test_load_legacy_format(self):
+    def test_load_legacy_format(self, tmp_path):
         """Loading old-format weights should return fresh policy trainer."""
         weights = np.random.randn(NUM_FEATURES).tolist()
 
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
+        path = str(tmp_path / 'weights.json')
+        with open(path, 'w') as f:
             json.dump(weights, f)
-            path = f.name
 
         vt, pt = load_combined_weights(path, value_lr=0.01, policy_lr=0.02)
 
         assert isinstance(vt, LinearTrainer)
-        np.testing.assert_allclose(vt.weights, np.array(weights), atol=1e-10)
+        assert np.array_equal(vt.weights, np.array(weights))
         # Policy trainer should be fresh (zero weights)
         assert np.all(pt.weights == 0.0)
 
-        Path(path).unlink()
-
-    def test_combined_format_json_structure(self):
+    def test_combined_format_json_structure(self, tmp_path):
         vt = LinearTrainer(learning_rate=0.01)
         vt.weights = np.ones(NUM_FEATURES)
         pt = PolicyTrainer()
         pt.weights = np.ones(POLICY_INPUT_SIZE) * 0.5
 
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
-            path = f.name
-
+        path = str(tmp_path / 'weights.json')
         save_combined_weights(vt, pt, path)
 
         with open(path) as f:
@@ -169,5 +190,3 @@ class TestCombinedWeights:
         assert 'policy_bias' in data
         assert len(data['value_weights']) == NUM_FEATURES
         assert len(data['policy_weights']) == POLICY_INPUT_SIZE
-
-        Path(path).unlink()
@@ -1,9 +1,9 @@
 """Tests for ReplayBuffer."""
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import pickle
 
+import numpy as np
 import pytest
 
 from blood_bowl.replay_buffer import ReplayBuffer, Transition
@@ -19,16 +19,21 @@ def _make_game_log(n_features: int = 5, winner: str = 'home') -> list:
     ]
 
 
+# Built once — add_game only reads the log. Tests that would mutate must
+# deepcopy.
+_GAME_LOG = _make_game_log()
+
+
 class TestReplayBuffer:
     def test_add_game_extracts_transitions(self):
         buf = ReplayBuffer(capacity=100)
-        buf.add_game(_make_game_log())
+        buf.add_game(_GAME_LOG)
         # 2 home states + 2 away states = 4 transitions
         assert len(buf) == 4
 
     def test_transition_rewards(self):
         buf = ReplayBuffer(capacity=100)
-        buf.add_game(_make_game_log(winner='home'))
+        buf.add_game(_GAME_LOG)
         transitions = list(buf.buffer)
         home_transitions = [t for t in transitions if t.perspective == 'home']
         away_transitions = [t for t in transitions if t.perspective == 'away']
@@ -40,7 +45,7 @@ class TestReplayBuffer:
 
     def test_transition_terminal_flag(self):
         buf = ReplayBuffer(capacity=100)
-        buf.add_game(_make_game_log())
+        buf.add_game(_GAME_LOG)
         transitions = list(buf.buffer)
         home_transitions = [t for t in transitions if t.perspective == 'home']
         # Last home state should be terminal
@@ -63,36 +68,35 @@ class TestReplayBuffer:
     def test_sample_returns_correct_count(self):
         buf = ReplayBuffer(capacity=100)
         for _ in range(5):
-            buf.add_game(_make_game_log())
+            buf.add_game(_GAME_LOG)
         assert len(buf) == 20
         sample = buf.sample(batch_size=10)
         assert len(sample) == 10
 
     def test_sample_clamps_to_buffer_size(self):
         buf = ReplayBuffer(capacity=100)
-        buf.add_game(_make_game_log())
+        buf.add_game(_GAME_LOG)
         sample = buf.sample(batch_size=100)
         assert len(sample) == 4
 
     def test_capacity_limit(self):
         buf = ReplayBuffer(capacity=5)
-        for _ in range(10):
-            buf.add_game(_make_game_log())
+        buf.add_games([_GAME_LOG] * 10)
         assert len(buf) == 5
 
-    def test_save_load_roundtrip(self):
+    def test_save_load_roundtrip(self, tmp_path):
         buf = ReplayBuffer(capacity=100)
-        buf.add_game(_make_game_log())
+        buf.add_game(_GAME_LOG)
         original_len = len(buf)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = str(Path(tmpdir) / 'buffer.pkl')
-            buf.save(path)
+        path = str(tmp_path / 'buffer.pkl')
+        buf.save(path)
 
-            buf2 = ReplayBuffer(capacity=100)
-            buf2.load(path)
-            assert len(buf2) == original_len
-            assert buf2.buffer[0].features == buf.buffer[0].features
+        buf2 = ReplayBuffer(capacity=100)
+        buf2.load(path)
+        assert len(buf2) == original_len
+        np.testing.assert_array_equal(buf2.buffer[0].features,
+                                      buf.buffer[0].features)
 
     def test_no_result_skips(self):
         buf = ReplayBuffer(capacity=100)
@@ -106,3 +110,81 @@ class TestReplayBuffer:
         buf = ReplayBuffer(capacity=100)
         sample = buf.sample(batch_size=10)
         assert len(sample) == 0
+
+
+class TestMemmapBackend:
+    def test_add_and_sample(self, tmp_path):
+        buf = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path))
+        buf.add_game(_GAME_LOG)
+        assert len(buf) == 4
+        sample = buf.sample(batch_size=4)
+        home = [t for t in sample if t.perspective == 'home']
+        assert all(t.reward == 1.0 for t in home)
+        assert all(len(t.features) == 5 for t in sample)
+
+    def test_capacity_wraps(self, tmp_path):
+        buf = ReplayBuffer(capacity=5, memmap_dir=str(tmp_path))
+        for _ in range(10):
+            buf.add_game(_GAME_LOG)
+        assert len(buf) == 5
+
+    def test_persists_across_instances(self, tmp_path):
+        buf = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path))
+        buf.add_game(_GAME_LOG)
+        buf.flush()
+
+        buf2 = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path))
+        assert len(buf2) == len(buf)
+        sample = buf2.sample(batch_size=4)
+        assert len(sample) == 4
+
+    def test_pickle_migration(self, tmp_path):
+        legacy = ReplayBuffer(capacity=100)
+        legacy.add_game(_GAME_LOG)
+        pkl_path = str(tmp_path / 'buffer.pkl')
+        legacy.save(pkl_path)
+
+        buf = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path / 'mm'))
+        buf.load(pkl_path)
+        assert len(buf) == len(legacy)
+
+    def test_save_exports_pickle_snapshot(self, tmp_path):
+        """save() must export a portable pickle even for the memmap backend
+        (run_iteration archives replay_buffer.pkl every iteration)."""
+        buf = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path / 'mm'))
+        buf.add_game(_GAME_LOG)
+        pkl_path = str(tmp_path / 'buffer.pkl')
+        buf.save(pkl_path)
+
+        loaded = ReplayBuffer(capacity=100)
+        loaded.load(pkl_path)
+        assert len(loaded) == len(buf)
+
+    def test_feat_dim_change_resets_store(self, tmp_path):
+        buf = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path))
+        buf.add_game(_GAME_LOG)  # 5 features
+        buf.flush()
+
+        buf2 = ReplayBuffer(capacity=100, memmap_dir=str(tmp_path))
+        buf2.add_game(_make_game_log(n_features=8))
+        assert len(buf2) == 4
+        assert all(len(t.features) == 8 for t in buf2.sample(4))
+
+    def test_migration_preserves_none_mc_return(self, tmp_path):
+        """Pre-mc_return pickles must keep the None sentinel through memmap.
+
+        Consumers fall back to the one-step target on None; silently turning
+        it into 0.0 would train the value head toward G=0 for every migrated
+        transition."""
+        feats = np.zeros(3, dtype=np.float32)
+        legacy = [Transition(features=feats, reward=1.0, next_features=feats,
+                             perspective='home', is_terminal=True)]
+        pkl_path = str(tmp_path / 'buffer.pkl')
+        with open(pkl_path, 'wb') as f:
+            pickle.dump(legacy, f)
+
+        buf = ReplayBuffer(capacity=10, memmap_dir=str(tmp_path / 'mm'))
+        buf.load(pkl_path)
+        t = buf.sample(1)[0]
+        assert t.mc_return is None
+        assert t.reward_step == 0.0
@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import json
-import tempfile
-from pathlib import Path
 
 import numpy as np
 import pytest
 
+from blood_bowl.features import NUM_FEATURES
 from blood_bowl.trainer import LinearTrainer, NeuralTrainer, create_trainer, load_trainer
 
 
@@ -22,6 +21,11 @@ def _make_alternating_game_log() -> list[dict]:
     ]
 
 
+# Built once — the trainers only read features/perspective, never mutate the
+# log. Tests that would mutate must deepcopy.
+_ALTERNATING_GAME_LOG = _make_alternating_game_log()
+
+
 class TestLinearTrainer:
     def test_train_monte_carlo_win_updates_toward_features(self):
         trainer = LinearTrainer(n_features=5, learning_rate=0.1)
@@ -58,26 +62,41 @@ class TestLinearTrainer:
 
         result = trainer.evaluate([1.0, 2.0, 3.0])
         # 2*1 + 3*2 + 1*3 = 11
-        assert abs(result - 11.0) < 0.001
+        assert result == pytest.approx(11.0, abs=1e-3)
 
-    def test_save_load_weights_roundtrip(self):
+    def test_save_load_weights_roundtrip(self, tmp_path):
         trainer = LinearTrainer(n_features=5, learning_rate=0.01)
         trainer.weights = np.array([1.5, -0.3, 0.7, 0.0, 2.1])
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = str(Path(tmpdir) / 'weights.json')
-            trainer.save_weights(path)
+        path = str(tmp_path / 'weights.json')
+        trainer.save_weights(path)
+
+        # Verify JSON format
+        with open(path) as f:
+            data = json.load(f)
+        assert len(data) == 5
+
+        # Load into new trainer
+        trainer2 = LinearTrainer(n_features=5)
+        trainer2.load_weights(path)
 
-            # Verify JSON format
-            with open(path) as f:
-                data = json.load(f)
-            assert len(data) == 5
+        np.testing.assert_array_almost_equal(trainer.weights, trainer2.weights)
 
-            # Load into new trainer
-            trainer2 = LinearTrainer(n_features=5)
-            trainer2.load_weights(path)
 
-            np.testing.assert_array_almost_equal(trainer.weights, trainer2.weights)
+_STANDARD_GAME_LOG = [
+    {'type': 'state', 'features': [1.0, 0.0, 0.5, 0.0, 1.0], 'perspective': 'home'},
+    {'type': 'state', 'features': [1.0, 0.0, 0.6, 0.0, 1.0], 'perspective': 'home'},
+    {'type': 'result', 'home_score': 2, 'away_score': 1, 'winner': 'home'},
+]
+
+
+@pytest.fixture(scope='class')
+def mc_reference():
+    """Weights after one standard MC pass over _STANDARD_GAME_LOG, trained
+    once per class instead of inside every test that compares against it."""
+    trainer = LinearTrainer(n_features=5, learning_rate=0.1)
+    trainer.train_monte_carlo(_STANDARD_GAME_LOG)
+    return trainer.weights.copy()
 
 
 class TestMonteCarloShaped:
@@ -93,27 +112,16 @@ class TestMonteCarloShaped:
         trainer.train_monte_carlo_shaped(game_log)
         assert not np.array_equal(trainer.weights, old_weights)
 
-    def test_zero_shaping_similar_to_standard_mc(self):
+    def test_zero_shaping_similar_to_standard_mc(self, mc_reference):
         """With zero shaping weights, shaped MC should behave like standard MC."""
-        game_log = [
-            {'type': 'state', 'features': [1.0, 0.0, 0.5, 0.0, 1.0], 'perspective': 'home'},
-            {'type': 'state', 'features': [1.0, 0.0, 0.6, 0.0, 1.0], 'perspective': 'home'},
-            {'type': 'result', 'home_score': 2, 'away_score': 1, 'winner': 'home'},
-        ]
-
-        # Standard MC
-        trainer_mc = LinearTrainer(n_features=5, learning_rate=0.1)
-        trainer_mc.train_monte_carlo(game_log)
-
-        # Shaped MC with zero shaping
         trainer_shaped = LinearTrainer(n_features=5, learning_rate=0.1)
-        trainer_shaped.train_monte_carlo_shaped(game_log, shaping_weights=[])
+        trainer_shaped.train_monte_carlo_shaped(_STANDARD_GAME_LOG, shaping_weights=[])
 
-        np.testing.assert_array_almost_equal(trainer_mc.weights, trainer_shaped.weights, decimal=5)
+        np.testing.assert_array_almost_equal(mc_reference, trainer_shaped.weights, decimal=5)
 
     def test_shaped_handles_alternating_perspectives(self):
         trainer = LinearTrainer(n_features=5, learning_rate=0.1)
-        game_log = _make_alternating_game_log()
+        game_log = _ALTERNATING_GAME_LOG
 
         old_weights = trainer.weights.copy()
         trainer.train_monte_carlo_shaped(game_log)
@@ -165,7 +173,7 @@ class TestTDLambda:
     def test_perspective_isolation(self):
         """Home and away states should be trained independently."""
         trainer = LinearTrainer(n_features=5, learning_rate=0.1)
-        game_log = _make_alternating_game_log()
+        game_log = _ALTERNATING_GAME_LOG
 
         old_weights = trainer.weights.copy()
         trainer.train_td_lambda(game_log, lambda_=0.8)
@@ -189,7 +197,7 @@ class TestTD0Perspective:
     def test_td0_groups_by_perspective(self):
         """TD(0) should group states by perspective, not bootstrap across alternating sides."""
         trainer = LinearTrainer(n_features=5, learning_rate=0.1)
-        game_log = _make_alternating_game_log()
+        game_log = _ALTERNATING_GAME_LOG
 
         old_weights = trainer.weights.copy()
         trainer.train_td0(game_log, gamma=0.99)
@@ -215,7 +223,7 @@ class TestComputePotential:
         shaping = [(1, 3.0), (2, -1.0)]
         result = LinearTrainer._compute_potential(features, shaping)
         # 3.0 * 0.5 + (-1.0) * 0.3 = 1.5 - 0.3 = 1.2
-        assert abs(result - 1.2) < 0.001
+        assert result == pytest.approx(1.2, abs=1e-3)
 
     def test_empty_shaping(self):
         features = np.array([1.0, 2.0, 3.0])
@@ -225,7 +233,7 @@ class TestComputePotential:
     def test_out_of_bounds_index_ignored(self):
         features = np.array([1.0, 2.0])
         result = LinearTrainer._compute_potential(features, [(0, 1.0), (5, 2.0)])
-        assert abs(result - 1.0) < 0.001
+        assert result == pytest.approx(1.0, abs=1e-3)
 
 
 # ---- NeuralTrainer tests ----
@@ -239,115 +247,131 @@ def _make_neural_game_log(n_features: int = 5) -> list[dict]:
     ]
 
 
+# Canonical 5x4 Xavier init, drawn once from a PCG64 generator. Tests copy
+# these instead of re-seeding the global Mersenne Twister in every method.
+_INIT_RNG = np.random.default_rng(42)
+_L1 = np.sqrt(6.0 / (5 + 4))
+_L2 = np.sqrt(6.0 / (4 + 1))
+_SMALL_W1 = _INIT_RNG.uniform(-_L1, _L1, (5, 4))
+_SMALL_W2 = _INIT_RNG.uniform(-_L2, _L2, (4, 1))
+
+
+def _seeded_neural(learning_rate: float = 0.01) -> NeuralTrainer:
+    """5x4 NeuralTrainer with deterministic weights from the cached init."""
+    trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=learning_rate)
+    trainer.W1 = _SMALL_W1.copy()
+    trainer.W2 = _SMALL_W2.copy()
+    return trainer
+
+
+@pytest.fixture(scope='class')
+def small_neural():
+    """Shared 5x4 network for the tests that never train it.
+
+    Class-scoped so the weight-matrix init runs once; tests that update
+    weights still build their own trainer via _seeded_neural().
+    """
+    return _seeded_neural()
+
+
 class TestNeuralTrainer:
-    def test_forward_output_in_tanh_range(self):
+    def test_forward_output_in_tanh_range(self, small_neural):
         """Output of forward pass should be in [-1, 1] due to tanh."""
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
         features = np.array([0.5, -0.3, 0.7, 0.0, 1.0])
-        value, hidden = trainer.forward(features)
+        value, hidden = small_neural.forward(features)
         assert -1.0 <= value <= 1.0
         assert hidden.shape == (4,)
         # ReLU: all hidden activations >= 0
         assert np.all(hidden >= 0)
 
-    def test_forward_deterministic(self):
+    def test_forward_deterministic(self, small_neural):
         """Same input should produce same output."""
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
         features = np.array([0.5, -0.3, 0.7, 0.0, 1.0])
-        v1, _ = trainer.forward(features)
-        v2, _ = trainer.forward(features)
+        v1, _ = small_neural.forward(features)
+        v2, _ = small_neural.forward(features)
         assert v1 == v2
 
-    def test_evaluate_matches_forward(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
+    def test_evaluate_matches_forward(self, small_neural):
         features = [0.5, -0.3, 0.7, 0.0, 1.0]
-        v_eval = trainer.evaluate(features)
-        v_fwd, _ = trainer.forward(np.array(features, dtype=np.float64))
-        assert abs(v_eval - v_fwd) < 1e-10
+        v_eval = small_neural.evaluate(features)
+        v_fwd, _ = small_neural.forward(np.array(features, dtype=np.float64))
+        assert v_eval == pytest.approx(v_fwd, abs=1e-10)
 
     def test_train_mc_changes_weights(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
+        trainer = _seeded_neural(learning_rate=0.1)
         W1_before = trainer.W1.copy()
         trainer.train_monte_carlo(_make_neural_game_log())
         assert not np.array_equal(trainer.W1, W1_before)
 
     def test_train_mc_shaped_changes_weights(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
+        trainer = _seeded_neural(learning_rate=0.1)
         W1_before = trainer.W1.copy()
         trainer.train_monte_carlo_shaped(_make_neural_game_log())
         assert not np.array_equal(trainer.W1, W1_before)
 
     def test_train_td0_changes_weights(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
+        trainer = _seeded_neural(learning_rate=0.1)
         W1_before = trainer.W1.copy()
         trainer.train_td0(_make_neural_game_log())
         assert not np.array_equal(trainer.W1, W1_before)
 
     def test_train_td_lambda_changes_weights(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
+        trainer = _seeded_neural(learning_rate=0.1)
         W1_before = trainer.W1.copy()
         trainer.train_td_lambda(_make_neural_game_log())
         assert not np.array_equal(trainer.W1, W1_before)
 
-    def test_save_load_roundtrip(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
+    def test_save_load_roundtrip(self, tmp_path):
+        trainer = _seeded_neural()
         features = [0.5, -0.3, 0.7, 0.0, 1.0]
         v_before = trainer.evaluate(features)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = str(Path(tmpdir) / 'neural_weights.json')
-            trainer.save_weights(path)
+        path = str(tmp_path / 'neural_weights.json')
+        trainer.save_weights(path)
 
-            # Verify JSON format
-            with open(path) as f:
-                data = json.load(f)
-            assert data['type'] == 'neural'
-            assert data['hidden_size'] == 4
-            assert len(data['W1']) == 5  # n_features rows
-            assert len(data['W1'][0]) == 4  # hidden_size cols
+        # Verify JSON format
+        with open(path) as f:
+            data = json.load(f)
+        assert data['type'] == 'neural'
+        assert data['hidden_size'] == 4
+        assert len(data['W1']) == 5  # n_features rows
+        assert len(data['W1'][0]) == 4  # hidden_size cols
 
-            # Load into new trainer
-            trainer2 = NeuralTrainer(n_features=5, hidden_size=4)
-            trainer2.load_weights(path)
-            v_after = trainer2.evaluate(features)
-            assert abs(v_before - v_after) < 1e-10
+        # Load into new trainer
+        trainer2 = NeuralTrainer(n_features=5, hidden_size=4)
+        trainer2.load_weights(path)
+        v_after = trainer2.evaluate(features)
+        assert v_before == pytest.approx(v_after, abs=1e-10)
 
     def test_handles_56_features(self):
-        np.random.seed(42)
         trainer = NeuralTrainer(n_features=56, hidden_size=32)
         features = [float(i) / 56.0 for i in range(56)]
         value = trainer.evaluate(features)
         assert -1.0 <= value <= 1.0
 
-    def test_feature_alignment_pads(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
+    def test_feature_alignment_pads(self, small_neural):
         # Only 3 features provided — should pad to 5
         short_features = np.array([0.5, -0.3, 0.7])
-        padded = trainer._align_features(short_features)
+        padded = small_neural._align_features(short_features)
         assert len(padded) == 5
         assert padded[3] == 0.0
         assert padded[4] == 0.0
 
-    def test_feature_alignment_truncates(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4)
+    def test_feature_alignment_truncates(self, small_neural):
         long_features = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7])
-        truncated = trainer._align_features(long_features)
+        truncated = small_neural._align_features(long_features)
         assert len(truncated) == 5
 
+    @pytest.mark.heavy
     def test_gradient_check(self):
-        """Numerical gradient check: verify analytical gradients are correct."""
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.01)
+        """Numerical gradient check: verify analytical gradients are correct.
+
+        Finite differences are batched — one stacked forward pass over all
+        perturbed weight copies instead of two `forward` calls per element,
+        and one vector comparison per weight matrix instead of per-element
+        asserts.
+        """
+        trainer = _seeded_neural()
         features = np.array([0.5, -0.3, 0.7, 0.0, 1.0])
         target = 0.7
 
@@ -355,45 +379,38 @@ class TestNeuralTrainer:
 
         eps = 1e-5
 
-        # Check a few W1 elements
-        for i in range(min(3, trainer.n_features)):
-            for j in range(min(2, trainer.hidden_size)):
-                original = trainer.W1[i, j]
-
-                trainer.W1[i, j] = original + eps
-                v_plus, _ = trainer.forward(features)
-                loss_plus = 0.5 * (target - v_plus) ** 2
-
-                trainer.W1[i, j] = original - eps
-                v_minus, _ = trainer.forward(features)
-                loss_minus = 0.5 * (target - v_minus) ** 2
-
-                trainer.W1[i, j] = original
-                numerical_grad = (loss_plus - loss_minus) / (2 * eps)
-                assert abs(dW1[i, j] - numerical_grad) < 1e-4, \
-                    f'W1[{i},{j}]: analytical={dW1[i,j]:.6f}, numerical={numerical_grad:.6f}'
-
-        # Check a few W2 elements
-        for j in range(min(3, trainer.hidden_size)):
-            original = trainer.W2[j, 0]
-
-            trainer.W2[j, 0] = original + eps
-            v_plus, _ = trainer.forward(features)
-            loss_plus = 0.5 * (target - v_plus) ** 2
-
-            trainer.W2[j, 0] = original - eps
-            v_minus, _ = trainer.forward(features)
-            loss_minus = 0.5 * (target - v_minus) ** 2
-
-            trainer.W2[j, 0] = original
-            numerical_grad = (loss_plus - loss_minus) / (2 * eps)
-            assert abs(dW2[j, 0] - numerical_grad) < 1e-4, \
-                f'W2[{j},0]: analytical={dW2[j,0]:.6f}, numerical={numerical_grad:.6f}'
+        def batched_loss(h_stack):
+            out = np.tanh(h_stack + trainer.b2)  # (K, 1)
+            return 0.5 * (target - out[:, 0]) ** 2
+
+        # Check a few W1 elements: stack +eps/-eps copies of W1 per element
+        w1_checks = [(i, j)
+                     for i in range(min(3, trainer.n_features))
+                     for j in range(min(2, trainer.hidden_size))]
+        w1_stack = np.repeat(trainer.W1[None, :, :], 2 * len(w1_checks), axis=0)
+        for k, (i, j) in enumerate(w1_checks):
+            w1_stack[2 * k, i, j] += eps
+            w1_stack[2 * k + 1, i, j] -= eps
+        hidden = np.maximum(np.einsum('f,kfh->kh', features, w1_stack) + trainer.b1, 0.0)
+        losses = batched_loss(hidden @ trainer.W2)
+        numerical_w1 = (losses[0::2] - losses[1::2]) / (2 * eps)
+        analytical_w1 = dW1[tuple(np.transpose(w1_checks))]
+        np.testing.assert_allclose(analytical_w1, numerical_w1, atol=1e-4)
+
+        # Check a few W2 elements the same way (hidden layer is unperturbed)
+        w2_checks = list(range(min(3, trainer.hidden_size)))
+        h = np.maximum(features @ trainer.W1 + trainer.b1, 0.0)
+        w2_stack = np.repeat(trainer.W2[None, :, :], 2 * len(w2_checks), axis=0)
+        for k, j in enumerate(w2_checks):
+            w2_stack[2 * k, j, 0] += eps
+            w2_stack[2 * k + 1, j, 0] -= eps
+        losses = batched_loss(np.einsum('h,kho->ko', h, w2_stack))
+        numerical_w2 = (losses[0::2] - losses[1::2]) / (2 * eps)
+        np.testing.assert_allclose(dW2[w2_checks, 0], numerical_w2, atol=1e-4)
 
     def test_alternating_perspectives(self):
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
-        game_log = _make_alternating_game_log()
+        trainer = _seeded_neural(learning_rate=0.1)
+        game_log = _ALTERNATING_GAME_LOG
         W1_before = trainer.W1.copy()
         trainer.train_td_lambda(game_log, lambda_=0.8)
         assert not np.array_equal(trainer.W1, W1_before)
@@ -413,29 +430,28 @@ class TestCreateTrainer:
 
 
 class TestLoadTrainer:
-    def test_load_linear_weights(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = str(Path(tmpdir) / 'linear.json')
-            with open(path, 'w') as f:
-                json.dump([1.0, 2.0, 3.0, 4.0, 5.0], f)
-
-            trainer = load_trainer(path)
-            assert isinstance(trainer, LinearTrainer)
-            assert abs(trainer.evaluate([1.0, 0.0, 0.0, 0.0, 0.0] + [0.0] * 43) - 1.0) < 0.001
-
-    def test_load_neural_weights(self):
-        np.random.seed(42)
-        original = NeuralTrainer(n_features=5, hidden_size=4)
+    def test_load_linear_weights(self, tmp_path):
+        path = str(tmp_path / 'linear.json')
+        with open(path, 'w') as f:
+            json.dump([1.0, 2.0, 3.0, 4.0, 5.0], f)
+
+        trainer = load_trainer(path)
+        assert isinstance(trainer, LinearTrainer)
+        feats = np.zeros(NUM_FEATURES)
+        feats[0] = 1.0
+        assert trainer.evaluate(feats) == pytest.approx(1.0, abs=1e-3)
+
+    def test_load_neural_weights(self, tmp_path):
+        original = _seeded_neural()
         features = [0.5, -0.3, 0.7, 0.0, 1.0]
         v_original = original.evaluate(features)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = str(Path(tmpdir) / 'neural.json')
-            original.save_weights(path)
+        path = str(tmp_path / 'neural.json')
+        original.save_weights(path)
 
-            trainer = load_trainer(path)
-            assert isinstance(trainer, NeuralTrainer)
-            assert abs(trainer.evaluate(features) - v_original) < 1e-10
+        trainer = load_trainer(path)
+        assert isinstance(trainer, NeuralTrainer)
+        assert trainer.evaluate(features) == pytest.approx(v_original, abs=1e-10)
 
 
 class TestTrainTransitionShaped:
@@ -450,16 +466,16 @@ class TestTrainTransitionShaped:
             t = LinearTrainer(n_features=5, learning_rate=0.1)
             t.train_transition_shaped(f, nf, final_reward=1.0,
                                       is_terminal=is_terminal, shaping_weights=[])
-            assert abs(t.weights[0] - 0.1) < 1e-9   # lr * 1.0 * f[0]
-            assert abs(t.weights[1]) < 1e-9          # next_features NOT trained
+            assert t.weights[0] == pytest.approx(0.1, abs=1e-9)  # lr * 1.0 * f[0]
+            assert t.weights[1] == pytest.approx(0.0, abs=1e-9)  # next_features NOT trained
 
     def test_matches_monte_carlo_shaped_first_state(self):
         # train_transition_shaped on (f, nf, non-terminal) must equal the state[0]
         # update of train_monte_carlo_shaped on a [f, nf, result] single-perspective
         # log — and must NOT also train nf (which the old 2-state mini-log did).
-        np.random.seed(0)
-        f = list(np.random.randn(5))
-        nf = list(np.random.randn(5))
+        rng = np.random.default_rng(0)
+        f = list(rng.standard_normal(5))
+        nf = list(rng.standard_normal(5))
         sw = [(0, 0.5), (2, -0.3)]
 
         a = LinearTrainer(n_features=5, learning_rate=0.05)
@@ -504,8 +520,7 @@ class TestMonteCarloReturnLeverB:
         ]
 
     def _captured_neural_targets(self, game_log: list[dict]) -> list[float]:
-        np.random.seed(42)
-        trainer = NeuralTrainer(n_features=5, hidden_size=4, learning_rate=0.1)
+        trainer = _seeded_neural(learning_rate=0.1)
         captured: list[float] = []
         orig = trainer._backprop
         trainer._backprop = lambda f, t: (captured.append(t), orig(f, t))[1]
@@ -1255,9 +1255,13 @@ def _git_push(root: Path, promote: bool, frozen_path: Path, gate_path: Path,
         policy_snap_path = root / 'weights_best_policy.json'
         policy_snap_data = policy_snap_path.read_bytes() if policy_snap_path.exists() else None
 
-        # Pull latest to avoid conflict, then add our files
-        subprocess.run(['git', 'fetch', 'origin'], cwd=str(root), capture_output=True)
-        subprocess.run(['git', 'reset', '--hard', 'origin/main'], cwd=str(root), capture_output=True)
+        # Pull latest to avoid conflict, then add our files. Output of the
+        # intermediate git calls is never inspected — DEVNULL skips the pipe
+        # allocation and copy that capture_output would pay per call.
+        subprocess.run(['git', 'fetch', 'origin'], cwd=str(root),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.run(['git', 'reset', '--hard', 'origin/main'], cwd=str(root),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         # Re-apply weights after reset (reset overwrites working tree)
         best_path = root / 'weights_best.json'
@@ -1279,18 +1283,20 @@ def _git_push(root: Path, promote: bool, frozen_path: Path, gate_path: Path,
         if policy_snap_data is not None:
             files.append('weights_best_policy.json')
         snaps = [f for f in os.listdir(str(root)) if f.startswith('weights_snap_')]
-        subprocess.run(['git', 'add', '-f'] + files + snaps, cwd=str(root), capture_output=True)
+        subprocess.run(['git', 'add', '-f'] + files + snaps, cwd=str(root),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         bm_str = f'{new_bm:.1%}'
         subprocess.run(
             ['git', 'commit', '-m', f'AlphaZero: bm={bm_str} chess={chess_score:.1%} ({label})'],
-            cwd=str(root), capture_output=True,
+            cwd=str(root), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
         )
         r = subprocess.run(['git', 'push'], cwd=str(root), capture_output=True)
         if r.returncode == 0:
             print('Pushed!')
         else:
-            print(f'Push failed: {r.stderr.decode()[:300]}')
+            # Slice BEFORE decoding: push failures can dump kilobytes of stderr
+            print(f'Push failed: {r.stderr[:300].decode("utf-8", errors="replace")}')
             print('(Weights jsou uloženy lokálně)')
     except Exception as e:
         print(f'Git push failed: {e} — weights uloženy lokálně')